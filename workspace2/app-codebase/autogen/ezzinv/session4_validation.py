@@ -4,35 +4,111 @@ Session 4 Validation Script
 Direct validation of Session 4 self-building components
 """
 
+import asyncio
+import io
 import sys
 import os
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+try:
+    import aiofiles
+    import aiofiles.os
+
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Add src to path (guarded - duplicate entries slow every import's path scan)
+_SRC_PATH = str(Path(__file__).parent / "src")
+if _SRC_PATH not in sys.path:
+    sys.path.insert(0, _SRC_PATH)
 
 print("🚀 SESSION 4: SELF-BUILDING & AUTOMATION VALIDATION")
 print("=" * 60)
 
-def validate_file_exists(filepath, description):
+# Single-pass scandir over the two directories every validator touches;
+# existence checks become dict lookups instead of per-file stat syscalls
+_STAT_CACHE = {}
+
+def _scan_dir(directory):
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                _STAT_CACHE[os.path.normpath(entry.path)] = entry.stat()
+    except OSError:
+        pass
+
+for _directory in ("src/ezzinv/automation", "."):
+    _scan_dir(_directory)
+
+def _exists(path):
+    """Existence check served from the one-pass scandir cache"""
+    return os.path.normpath(path) in _STAT_CACHE
+
+# One cached read per file - downstream validators do dict lookups only
+_FILE_CACHE = {}
+
+def _read(path):
+    """Read a file once and cache its contents (None if missing)"""
+    if path not in _FILE_CACHE:
+        _FILE_CACHE[path] = Path(path).read_text() if _exists(path) else None
+    return _FILE_CACHE[path]
+
+async def _read_async(path):
+    """Async counterpart of _read - overlaps file I/O under asyncio.gather"""
+    if path in _FILE_CACHE:
+        return _FILE_CACHE[path]
+    if AIOFILES_AVAILABLE:
+        if _exists(path):
+            async with aiofiles.open(path) as f:
+                _FILE_CACHE[path] = await f.read()
+        else:
+            _FILE_CACHE[path] = None
+        return _FILE_CACHE[path]
+    return await asyncio.to_thread(_read, path)
+
+def _symbol_scanner(needles):
+    """Build a scanner reporting which needles occur in a text in one pass"""
+    needles = tuple(needles)
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for needle in needles:
+            automaton.add_word(needle, needle)
+        automaton.make_automaton()
+
+        def scan(content):
+            return {found for _, found in automaton.iter(content)}
+    else:
+        def scan(content):
+            return {needle for needle in needles if needle in content}
+
+    return scan
+
+async def validate_file_exists(filepath, description, out=sys.stdout):
     """Validate a file exists"""
-    if Path(filepath).exists():
-        lines = len(Path(filepath).read_text().splitlines())
-        print(f"✅ {description}: {filepath} ({lines} lines)")
+    text = await _read_async(filepath)
+    if text is not None:
+        lines = text.count("\n") + (not text.endswith("\n"))
+        print(f"✅ {description}: {filepath} ({lines} lines)", file=out)
         return True
     else:
-        print(f"❌ {description}: {filepath} (NOT FOUND)")
+        print(f"❌ {description}: {filepath} (NOT FOUND)", file=out)
         return False
 
-def validate_imports():
+def validate_imports(out=sys.stdout):
     """Validate imports work"""
-    print("\n🔧 VALIDATING IMPORTS...")
+    print("\n🔧 VALIDATING IMPORTS...", file=out)
     
     try:
-        # Core automation imports
-        sys.path.insert(0, "src")
-        
-        print("✅ Basic Python imports working")
+        # Core automation imports (src already on sys.path from module top)
+        print("✅ Basic Python imports working", file=out)
         
         # Test individual components
         files_to_check = [
@@ -45,20 +121,20 @@ def validate_imports():
         ]
         
         for file_path in files_to_check:
-            if Path(file_path).exists():
-                print(f"✅ Component file exists: {file_path}")
+            if _exists(file_path):
+                print(f"✅ Component file exists: {file_path}", file=out)
             else:
-                print(f"❌ Component missing: {file_path}")
+                print(f"❌ Component missing: {file_path}", file=out)
         
         return True
         
     except Exception as e:
-        print(f"❌ Import validation failed: {e}")
+        print(f"❌ Import validation failed: {e}", file=out)
         return False
 
-def validate_session4_components():
+async def validate_session4_components(out=sys.stdout):
     """Validate Session 4 components are complete"""
-    print("\n📋 VALIDATING SESSION 4 COMPONENTS...")
+    print("\n📋 VALIDATING SESSION 4 COMPONENTS...", file=out)
     
     components = [
         ("src/ezzinv/automation/error_recovery.py", "Error Recovery & Self-Healing System"),
@@ -71,16 +147,14 @@ def validate_session4_components():
         ("SESSION4_SUMMARY.md", "Session 4 Summary Documentation")
     ]
     
-    all_exist = True
-    for filepath, description in components:
-        exists = validate_file_exists(filepath, description)
-        all_exist = all_exist and exists
-    
-    return all_exist
+    results = await asyncio.gather(
+        *(validate_file_exists(filepath, description, out) for filepath, description in components)
+    )
+    return all(results)
 
-def validate_code_quality():
+def validate_code_quality(out=sys.stdout):
     """Validate code quality and structure"""
-    print("\n📊 VALIDATING CODE QUALITY...")
+    print("\n📊 VALIDATING CODE QUALITY...", file=out)
     
     # Check key components have substantial implementation
     key_files = {
@@ -91,21 +165,22 @@ def validate_code_quality():
     
     quality_score = 0
     for filepath, min_lines in key_files.items():
-        if Path(filepath).exists():
-            actual_lines = len(Path(filepath).read_text().splitlines())
+        text = _read(filepath)
+        if text is not None:
+            actual_lines = text.count("\n") + (not text.endswith("\n"))
             if actual_lines >= min_lines:
-                print(f"✅ {filepath}: {actual_lines} lines (meets {min_lines}+ requirement)")
+                print(f"✅ {filepath}: {actual_lines} lines (meets {min_lines}+ requirement)", file=out)
                 quality_score += 1
             else:
-                print(f"⚠️  {filepath}: {actual_lines} lines (below {min_lines} requirement)")
+                print(f"⚠️  {filepath}: {actual_lines} lines (below {min_lines} requirement)", file=out)
         else:
-            print(f"❌ {filepath}: Missing")
+            print(f"❌ {filepath}: Missing", file=out)
     
     return quality_score == len(key_files)
 
-def validate_session4_features():
+async def validate_session4_features(out=sys.stdout):
     """Validate Session 4 features are implemented"""
-    print("\n🎯 VALIDATING SESSION 4 FEATURES...")
+    print("\n🎯 VALIDATING SESSION 4 FEATURES...", file=out)
     
     # Check for key Session 4 feature implementations
     features = [
@@ -117,28 +192,34 @@ def validate_session4_features():
         ("PerformanceAutoTuner", "src/ezzinv/automation/performance_tuning.py")
     ]
     
+    # Prefetch all feature files concurrently before the scan
+    await asyncio.gather(*(_read_async(filepath) for _, filepath in features))
+
+    # One automaton over all class declarations, one scan per file
+    scan = _symbol_scanner(f"class {feature_name}" for feature_name, _ in features)
+
     features_found = 0
     for feature_name, filepath in features:
-        if Path(filepath).exists():
-            content = Path(filepath).read_text()
-            if f"class {feature_name}" in content:
-                print(f"✅ {feature_name} class implemented")
+        content = _read(filepath)
+        if content is not None:
+            if f"class {feature_name}" in scan(content):
+                print(f"✅ {feature_name} class implemented", file=out)
                 features_found += 1
             else:
-                print(f"❌ {feature_name} class not found in {filepath}")
+                print(f"❌ {feature_name} class not found in {filepath}", file=out)
         else:
-            print(f"❌ {filepath} not found")
+            print(f"❌ {filepath} not found", file=out)
     
     return features_found == len(features)
 
-def validate_integration():
+def validate_integration(out=sys.stdout):
     """Validate integration between components"""
-    print("\n🔄 VALIDATING SYSTEM INTEGRATION...")
+    print("\n🔄 VALIDATING SYSTEM INTEGRATION...", file=out)
     
     integration_file = "src/ezzinv/automation/session4_integration.py"
-    if Path(integration_file).exists():
-        content = Path(integration_file).read_text()
-        
+    content = _read(integration_file)
+    if content is not None:
+
         # Check for integration of all major components
         required_integrations = [
             "MCPDiscoveryEngine",
@@ -148,32 +229,42 @@ def validate_integration():
             "AutoGenSelfModificationSystem"
         ]
         
+        found = _symbol_scanner(required_integrations)(content)
+
         integrations_found = 0
         for integration in required_integrations:
-            if integration in content:
-                print(f"✅ {integration} integrated")
+            if integration in found:
+                print(f"✅ {integration} integrated", file=out)
                 integrations_found += 1
             else:
-                print(f"❌ {integration} not integrated")
+                print(f"❌ {integration} not integrated", file=out)
         
         return integrations_found == len(required_integrations)
     else:
-        print(f"❌ Integration file missing: {integration_file}")
+        print(f"❌ Integration file missing: {integration_file}", file=out)
         return False
 
-def generate_validation_report():
+async def generate_validation_report():
     """Generate final validation report"""
     print("\n" + "=" * 60)
     print("📊 SESSION 4 VALIDATION REPORT")
     print("=" * 60)
-    
-    # Run all validations
-    results = {
-        "File Structure": validate_session4_components(),
-        "Code Quality": validate_code_quality(),
-        "Feature Implementation": validate_session4_features(),
-        "System Integration": validate_integration()
-    }
+
+    # Run the four validators concurrently; each writes into its own buffer
+    # so output flushes in a deterministic order after the join
+    names = ("File Structure", "Code Quality", "Feature Implementation", "System Integration")
+    bufs = {name: io.StringIO() for name in names}
+    outcomes = await asyncio.gather(
+        validate_session4_components(bufs["File Structure"]),
+        asyncio.to_thread(validate_code_quality, bufs["Code Quality"]),
+        validate_session4_features(bufs["Feature Implementation"]),
+        asyncio.to_thread(validate_integration, bufs["System Integration"]),
+    )
+    results = dict(zip(names, outcomes))
+
+    for name in names:
+        sys.stdout.write(bufs[name].getvalue())
+    sys.stdout.flush()
     
     # Calculate scores
     total_tests = len(results)
@@ -216,8 +307,9 @@ def generate_validation_report():
     
     total_lines = 0
     for filepath in session4_files:
-        if Path(filepath).exists():
-            total_lines += len(Path(filepath).read_text().splitlines())
+        text = _read(filepath)
+        if text is not None:
+            total_lines += text.count("\n") + (not text.endswith("\n"))
     
     print(f"\n📊 SESSION 4 CODE METRICS:")
     print(f"   Total Lines of Code: {total_lines:,}")
@@ -243,7 +335,7 @@ def generate_validation_report():
 if __name__ == "__main__":
     try:
         # Run validation
-        success_rate = generate_validation_report()
+        success_rate = asyncio.run(generate_validation_report())
         
         if success_rate >= 80:
             exit(0)  # Success
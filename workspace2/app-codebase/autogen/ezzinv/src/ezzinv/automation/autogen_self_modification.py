@@ -4,17 +4,48 @@ Full agent-based self-modification using AutoGen multi-agent workflows
 """
 
 import asyncio
+import functools
+import random
+import heapq
+from collections import deque
+import itertools
 import json
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass, field
-from enum import Enum
+import types
+from typing import Dict, List, Mapping, Optional, Any, Callable, Sequence
+from dataclasses import asdict, dataclass, field
+from enum import Enum, IntEnum
 import logging
+import os
 from pathlib import Path
 import ast
 import importlib
-import subprocess
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken
+
+    _ENC = tiktoken.encoding_for_model("gpt-4o-mini")
+except Exception:
+    _ENC = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
 
 try:
     from autogen_agentchat.agents import AssistantAgent, UserProxyAgent
@@ -37,30 +68,243 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Monotonic task-ID source: no same-second collisions, stable under clock jumps
+_ID_COUNTER = itertools.count(1)
+
 
-class ModificationType(str, Enum):
-    """Types of self-modifications"""
+def _new_task_id(prefix: str) -> str:
+    """Build a unique, time-ordered task id"""
+    return f"{prefix}_{time.monotonic_ns()}_{next(_ID_COUNTER)}"
+
+# Agent system prompts, built once at import so re-inits share the strings
+_ARCHITECT_SYS = """You are a System Architect specializing in AI system design and optimization.
+                Your role is to:
+                1. Analyze system architecture and identify improvement opportunities
+                2. Design new features and integrations
+                3. Plan system-wide modifications
+                4. Ensure architectural consistency and best practices
+                
+                Always consider:
+                - System scalability and maintainability
+                - Integration points and dependencies
+                - Performance implications
+                - Security considerations
+                
+                Provide detailed implementation plans with step-by-step instructions."""
+
+_OPTIMIZER_SYS = """You are a Performance Optimizer specializing in system performance enhancement.
+                Your role is to:
+                1. Identify performance bottlenecks
+                2. Optimize algorithms and data structures
+                3. Improve caching strategies
+                4. Enhance database query performance
+                
+                Focus on:
+                - Response time optimization
+                - Memory usage efficiency
+                - CPU utilization optimization
+                - Throughput improvements
+                
+                Provide specific code optimizations and performance measurements."""
 
-    CODE_OPTIMIZATION = "code_optimization"
-    CONFIGURATION_TUNING = "configuration_tuning"
-    NEW_FEATURE_ADDITION = "new_feature_addition"
-    BUG_FIX = "bug_fix"
-    PERFORMANCE_ENHANCEMENT = "performance_enhancement"
-    SECURITY_IMPROVEMENT = "security_improvement"
-    ARCHITECTURE_REFINEMENT = "architecture_refinement"
-    INTEGRATION_ADDITION = "integration_addition"
+_DEBUGGER_SYS = """You are a Bug Hunter specializing in error detection and resolution.
+                Your role is to:
+                1. Analyze error patterns and root causes
+                2. Implement bug fixes and error handling
+                3. Improve system reliability
+                4. Enhance testing coverage
+                
+                Approach:
+                - Systematic error analysis
+                - Root cause identification
+                - Comprehensive testing
+                - Defensive programming practices
+                
+                Provide detailed bug fixes with test cases."""
 
+_CONFIGURATOR_SYS = """You are a Configuration Specialist focusing on system configuration optimization.
+                Your role is to:
+                1. Optimize system settings and parameters
+                2. Improve environment configuration
+                3. Enhance deployment configurations
+                4. Tune performance parameters
+                
+                Consider:
+                - Environment-specific optimizations
+                - Resource allocation
+                - Service configuration
+                - Monitoring and alerting setup
+                
+                Provide configuration recommendations with rationale."""
 
-class ModificationScope(str, Enum):
+_SECURITY_SYS = """You are a Security Specialist focusing on system security enhancement.
+                Your role is to:
+                1. Identify security vulnerabilities
+                2. Implement security improvements
+                3. Enhance authentication and authorization
+                4. Improve data protection
+                
+                Security areas:
+                - Input validation and sanitization
+                - Authentication and authorization
+                - Data encryption and protection
+                - Secure communication protocols
+                
+                Provide security recommendations with implementation details."""
+
+
+class _BloomFilter:
+    """Small fixed-size bloom filter backed by a single Python int bitset.
+
+    Membership is one hash plus four bit tests regardless of how many keys
+    were added; false positives are possible, false negatives are not.
+    """
+
+    __slots__ = ("_bits", "_size")
+
+    def __init__(self, size_bits: int = 8192):
+        self._bits = 0
+        self._size = size_bits
+
+    def _positions(self, key: str):
+        h1 = hash(key)
+        h2 = hash(key + "\x00")
+        for i in range(4):
+            yield (h1 + i * h2) % self._size
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self._bits |= 1 << pos
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits >> pos & 1 for pos in self._positions(key))
+
+
+def _to_test_path(path: str) -> str:
+    """Map a source path to its conventional test path in one pass; the
+    count=1 replace and tail slice avoid rescanning the string"""
+    if not path.endswith(".py"):
+        return path
+    return path.replace("src/", "tests/", 1)[:-3] + "_test.py"
+
+
+def _task_key(task: "ModificationTask") -> str:
+    """Stable dedup key over a task's type, scope and target files"""
+    return (
+        f"{task.task_type.value}|{task.scope.value}|"
+        f"{'/'.join(sorted(task.target_files))}"
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _encoded_prompt(message: str):
+    """Token IDs for a system message, cached across agent re-initializations"""
+    return _ENC.encode(message) if _ENC is not None else None
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_cached(path: str, mtime_ns: int, size: int) -> ast.AST:
+    """Parse a source file, memoized per (path, mtime, size) so tasks that
+    share target files skip the AST parser on unchanged sources"""
+    return ast.parse(Path(path).read_text())
+
+
+def _parse_target(path: str) -> ast.AST:
+    """Cached ast.parse of a target file; mtime in the key makes edits
+    invalidate the entry automatically"""
+    stat = os.stat(path)
+    return _parse_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+def _serialize_task(task: "ModificationTask") -> Dict[str, Any]:
+    """Serialize a task for memory storage without a per-call __dict__ copy"""
+    if orjson is not None:
+        return orjson.loads(
+            orjson.dumps(
+                task,
+                option=orjson.OPT_SERIALIZE_DATACLASS,
+                default=lambda o: (
+                    o.isoformat()
+                    if isinstance(o, datetime)
+                    else (
+                        o.value
+                        if isinstance(o, Enum)
+                        else dict(o) if isinstance(o, types.MappingProxyType) else str(o)
+                    )
+                ),
+            )
+        )
+    return asdict(task)
+
+
+# Shared read-only empty mapping used as an allocation-free dataclass default
+_EMPTY_MAP: Mapping[str, Any] = types.MappingProxyType({})
+
+# CPU/memory snapshot shared by all safety checks, refreshed at most once
+# per TTL window so bursts of task dispatches don't re-probe /proc each time
+_resource_cache = {"ts": 0.0, "cpu": 0.0, "mem": 0.0}
+_resource_lock = asyncio.Lock()
+
+# Body of the persistent pytest worker: imports pytest once, then runs one
+# file per stdin line and reports the exit code back on stdout
+_PYTEST_WORKER_SRC = (
+    "import sys, pytest\n"
+    "for line in sys.stdin:\n"
+    "    path = line.strip()\n"
+    "    if not path:\n"
+    "        break\n"
+    "    print(f'RESULT {pytest.main([path, \"-q\"])}', flush=True)\n"
+)
+
+
+async def _get_resource_snapshot(ttl: float = 2.0) -> tuple:
+    """Return (cpu_percent, memory_percent), cached for ttl seconds"""
+    if psutil is None:
+        return 0.0, 0.0
+
+    now = time.monotonic()
+    if now - _resource_cache["ts"] < ttl:
+        return _resource_cache["cpu"], _resource_cache["mem"]
+
+    async with _resource_lock:
+        # Another waiter may have refreshed while we queued on the lock
+        if time.monotonic() - _resource_cache["ts"] < ttl:
+            return _resource_cache["cpu"], _resource_cache["mem"]
+
+        _resource_cache["cpu"] = psutil.cpu_percent(interval=None)
+        _resource_cache["mem"] = psutil.virtual_memory().percent
+        _resource_cache["ts"] = time.monotonic()
+
+    return _resource_cache["cpu"], _resource_cache["mem"]
+
+
+class ModificationType(IntEnum):
+    """Types of self-modifications
+
+    IntEnum so hot-path comparisons are single integer ops and the values
+    double as bit indices in the capability masks.
+    """
+
+    CODE_OPTIMIZATION = 0
+    CONFIGURATION_TUNING = 1
+    NEW_FEATURE_ADDITION = 2
+    BUG_FIX = 3
+    PERFORMANCE_ENHANCEMENT = 4
+    SECURITY_IMPROVEMENT = 5
+    ARCHITECTURE_REFINEMENT = 6
+    INTEGRATION_ADDITION = 7
+
+
+class ModificationScope(IntEnum):
     """Scope of modifications"""
 
-    SINGLE_FILE = "single_file"
-    MODULE = "module"
-    SUBSYSTEM = "subsystem"
-    SYSTEM_WIDE = "system_wide"
+    SINGLE_FILE = 0
+    MODULE = 1
+    SUBSYSTEM = 2
+    SYSTEM_WIDE = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class ModificationTask:
     """Task for self-modification"""
 
@@ -73,16 +317,25 @@ class ModificationTask:
     target_files: List[str]
     success_criteria: List[str]
     rollback_plan: str
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # Empty-container defaults are shared immutable sentinels: the factory
+    # hands every task the same proxy (dataclasses rejects the proxy as a
+    # plain default), and write sites replace the whole field
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_MAP)
     created_at: datetime = field(default_factory=datetime.now)
     status: str = "pending"  # pending, in_progress, completed, failed, rolled_back
-    assigned_agents: List[str] = field(default_factory=list)
+    assigned_agents: Sequence[str] = ()
     estimated_duration: int = 3600  # seconds
     actual_duration: Optional[int] = None
-    test_results: Dict[str, Any] = field(default_factory=dict)
+    test_results: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_MAP)
+    # Computed once at creation; created_at never changes afterwards
+    created_at_iso: str = ""
+
+    def __post_init__(self):
+        if not self.created_at_iso:
+            self.created_at_iso = self.created_at.isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentCapability:
     """Agent capability definition"""
 
@@ -119,7 +372,15 @@ class AutoGenSelfModificationSystem:
         # Agent system state
         self.agents: Dict[str, Any] = {}
         self.active_tasks: Dict[str, ModificationTask] = {}
-        self.completed_tasks: List[ModificationTask] = []
+        # Inverted index file -> owning task id; conflict checks are O(1)
+        # per file instead of a scan over every active task
+        self._active_files: Dict[str, str] = {}
+        # Bounded so a long-running daemon stays memory-flat; evicted entries
+        # are archived to long-term memory before they fall out
+        self.completed_tasks: deque = deque(maxlen=256)
+        # Most-recently-touched tasks, maintained on state transitions so
+        # status polls read it directly instead of sorting task history
+        self._recent_tasks: deque = deque(maxlen=10)
         self.agent_teams: Dict[str, Any] = {}
 
         # Self-modification configuration
@@ -128,12 +389,77 @@ class AutoGenSelfModificationSystem:
         self.auto_rollback_on_failure = True
         self.modification_approval_required = False  # Set to True for human approval
 
-        # Task queue and prioritization
-        self.task_queue: List[ModificationTask] = []
+        # Task queue and prioritization: a min-heap on (priority, seq) plus
+        # side indexes so duplicate detection stays O(1) as the queue grows
+        self._task_heap: List[tuple] = []
+        self._task_seq = itertools.count()
+        self._task_index: Dict[str, ModificationTask] = {}
+        self._pending_typescope: set = set()
+        # Bloom filter over every task ever enqueued; blocks re-generation of
+        # an identical fix in O(1) without retaining the task objects
+        self._seen_task_keys = _BloomFilter()
+
+        # Memory writes are queued here and flushed in batches by
+        # _memory_flush_loop instead of paying one round-trip per event
+        self._memory_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+
+        # Dispatch primitives: the semaphore backpressures on concurrency
+        # slots, the event wakes the execution loop the moment work arrives
+        self._slots = asyncio.Semaphore(self.max_concurrent_modifications)
+        self._task_available = asyncio.Event()
+
+        # Long-lived pytest worker, started lazily on first verification;
+        # one process imports pytest once instead of per test run
+        self._pytest_worker = None
+        self._pytest_worker_lock = asyncio.Lock()
+        # Cap concurrent pytest children at the core count so a wide task
+        # burst can't fork an unbounded number of interpreters
+        self._test_slots = asyncio.Semaphore(os.cpu_count() or 2)
+        # Index of discovered test files; existence checks become hash
+        # lookups and the scan reruns only when tests/ changes
+        self._test_index: set = set()
+        self._tests_dir_mtime = -1
         self.task_generation_interval = 3600  # Generate new tasks every hour
+        self._idle_backoff = self.task_generation_interval
+
+        # Per-system RNG: avoids the module-global RNG's lock on hot paths
+        self._rng = random.Random()
 
         # Available agent capabilities
         self.agent_capabilities = self._define_agent_capabilities()
+        # Status-view cache; reset to None whenever capabilities change
+        self._agent_caps_view: Optional[Dict[str, List[str]]] = None
+        # Error-recovery status cache (monotonic ts, payload) with ~1s TTL
+        self._err_status_cache: tuple = (0.0, None)
+        # Memoized status payload; mutators flip the dirty flag so steady
+        # state polling returns the same dict with zero allocation
+        self._status_payload_cache: Optional[Dict[str, Any]] = None
+        self._status_dirty = True
+
+        # Capability vectors for vectorized agent matching
+        self._cap_matrix = None
+        if NUMPY_AVAILABLE:
+            self._build_capability_matrix()
+
+        # Precomputed task-type -> team-key dispatch table (default: architecture)
+        self._type_to_team_key = {
+            ModificationType.ARCHITECTURE_REFINEMENT: "architecture",
+            ModificationType.NEW_FEATURE_ADDITION: "architecture",
+            ModificationType.PERFORMANCE_ENHANCEMENT: "performance",
+            ModificationType.CODE_OPTIMIZATION: "performance",
+            ModificationType.BUG_FIX: "debugging",
+            ModificationType.CONFIGURATION_TUNING: "configuration",
+        }
+
+        # Softmax team dispatch: fixed key order plus a per-team in-flight
+        # counter used as a load penalty during selection
+        self._team_keys = ("architecture", "performance", "debugging", "configuration")
+        self._team_slot = {key: idx for idx, key in enumerate(self._team_keys)}
+        self._team_load = (
+            np.zeros(len(self._team_keys), dtype=np.float32)
+            if NUMPY_AVAILABLE
+            else None
+        )
 
         if AUTOGEN_AVAILABLE:
             self._initialize_agents()
@@ -222,115 +548,132 @@ class AutoGenSelfModificationSystem:
             ),
         }
 
+    def _build_capability_matrix(self):
+        """One-hot encode agent capabilities into a float32 matrix so task
+        matching becomes a single matrix-vector product"""
+        features = set()
+        for cap in self.agent_capabilities.values():
+            features.update(cap.specializations)
+            features.update(m.name for m in cap.supported_modifications)
+
+        self._cap_features = {name: idx for idx, name in enumerate(sorted(features))}
+        self._cap_agent_keys = list(self.agent_capabilities)
+
+        matrix = np.zeros(
+            (len(self._cap_agent_keys), len(self._cap_features)), dtype=np.float32
+        )
+        for row, key in enumerate(self._cap_agent_keys):
+            cap = self.agent_capabilities[key]
+            for feature in cap.specializations:
+                matrix[row, self._cap_features[feature]] = 1.0
+            for modification in cap.supported_modifications:
+                matrix[row, self._cap_features[modification.name]] = 1.0
+
+        self._cap_matrix = matrix
+
+        # Struct-of-arrays views for cheap vectorized pre-filtering
+        caps = [self.agent_capabilities[key] for key in self._cap_agent_keys]
+        self._cap_max_complexity = np.array(
+            [cap.max_complexity for cap in caps], dtype=np.int8
+        )
+        self._cap_supported_mask = np.array(
+            [
+                sum(1 << mod for mod in cap.supported_modifications)
+                for cap in caps
+            ],
+            dtype=np.uint64,
+        )
+
+    def _best_agent_for(self, task: ModificationTask) -> str:
+        """Pick the agent whose capability vector best matches the task"""
+        required = [task.task_type.name]
+        required.extend(task.metadata.get("required_specializations", ()))
+
+        if self._cap_matrix is not None:
+            requirement = np.zeros(len(self._cap_features), dtype=np.float32)
+            for feature in required:
+                idx = self._cap_features.get(feature)
+                if idx is not None:
+                    requirement[idx] = 1.0
+            scores = self._cap_matrix @ requirement
+
+            # Mask-and-compare across all agents in two vector ops
+            type_bit = np.uint64(1 << task.task_type)
+            eligible = ((self._cap_supported_mask & type_bit) != 0) & (
+                self._cap_max_complexity >= task.estimated_complexity
+            )
+            if eligible.any():
+                scores = np.where(eligible, scores, -1.0)
+            return self._cap_agent_keys[int(np.argmax(scores))]
+
+        # Fallback without NumPy: linear scan over the capability dicts
+        best_key, best_score = "architect", -1
+        for key, cap in self.agent_capabilities.items():
+            supported = {m.name for m in cap.supported_modifications}
+            score = sum(
+                feature in supported or feature in cap.specializations
+                for feature in required
+            )
+            if score > best_score:
+                best_key, best_score = key, score
+        return best_key
+
     def _initialize_agents(self):
         """Initialize AutoGen agents"""
         if not AUTOGEN_AVAILABLE:
             return
 
         try:
-            # Create OpenAI client for agents
-            client = OpenAIChatCompletionClient(
-                model="gpt-4o-mini", api_key=self.settings.openai_api_key
-            )
+            # Create (or reuse) the OpenAI client shared by all agents
+            if getattr(self, "_client", None) is None:
+                self._client = OpenAIChatCompletionClient(
+                    model="gpt-4o-mini", api_key=self.settings.openai_api_key
+                )
+            client = self._client
+
+            # Warm the tokenizer cache so re-inits skip prompt re-encoding
+            for message in (
+                _ARCHITECT_SYS,
+                _OPTIMIZER_SYS,
+                _DEBUGGER_SYS,
+                _CONFIGURATOR_SYS,
+                _SECURITY_SYS,
+            ):
+                _encoded_prompt(message)
 
             # System Architect Agent
             self.agents["architect"] = AssistantAgent(
                 name="SystemArchitect",
                 model_client=client,
-                system_message="""You are a System Architect specializing in AI system design and optimization.
-                Your role is to:
-                1. Analyze system architecture and identify improvement opportunities
-                2. Design new features and integrations
-                3. Plan system-wide modifications
-                4. Ensure architectural consistency and best practices
-                
-                Always consider:
-                - System scalability and maintainability
-                - Integration points and dependencies
-                - Performance implications
-                - Security considerations
-                
-                Provide detailed implementation plans with step-by-step instructions.""",
+                system_message=_ARCHITECT_SYS,
             )
 
             # Performance Optimizer Agent
             self.agents["optimizer"] = AssistantAgent(
                 name="PerformanceOptimizer",
                 model_client=client,
-                system_message="""You are a Performance Optimizer specializing in system performance enhancement.
-                Your role is to:
-                1. Identify performance bottlenecks
-                2. Optimize algorithms and data structures
-                3. Improve caching strategies
-                4. Enhance database query performance
-                
-                Focus on:
-                - Response time optimization
-                - Memory usage efficiency
-                - CPU utilization optimization
-                - Throughput improvements
-                
-                Provide specific code optimizations and performance measurements.""",
+                system_message=_OPTIMIZER_SYS,
             )
 
             # Bug Hunter Agent
             self.agents["debugger"] = AssistantAgent(
                 name="BugHunter",
                 model_client=client,
-                system_message="""You are a Bug Hunter specializing in error detection and resolution.
-                Your role is to:
-                1. Analyze error patterns and root causes
-                2. Implement bug fixes and error handling
-                3. Improve system reliability
-                4. Enhance testing coverage
-                
-                Approach:
-                - Systematic error analysis
-                - Root cause identification
-                - Comprehensive testing
-                - Defensive programming practices
-                
-                Provide detailed bug fixes with test cases.""",
+                system_message=_DEBUGGER_SYS,
             )
 
             # Configuration Specialist Agent
             self.agents["configurator"] = AssistantAgent(
                 name="ConfigurationSpecialist",
                 model_client=client,
-                system_message="""You are a Configuration Specialist focusing on system configuration optimization.
-                Your role is to:
-                1. Optimize system settings and parameters
-                2. Improve environment configuration
-                3. Enhance deployment configurations
-                4. Tune performance parameters
-                
-                Consider:
-                - Environment-specific optimizations
-                - Resource allocation
-                - Service configuration
-                - Monitoring and alerting setup
-                
-                Provide configuration recommendations with rationale.""",
+                system_message=_CONFIGURATOR_SYS,
             )
 
             # Security Specialist Agent
             self.agents["security_specialist"] = AssistantAgent(
                 name="SecuritySpecialist",
                 model_client=client,
-                system_message="""You are a Security Specialist focusing on system security enhancement.
-                Your role is to:
-                1. Identify security vulnerabilities
-                2. Implement security improvements
-                3. Enhance authentication and authorization
-                4. Improve data protection
-                
-                Security areas:
-                - Input validation and sanitization
-                - Authentication and authorization
-                - Data encryption and protection
-                - Secure communication protocols
-                
-                Provide security recommendations with implementation details.""",
+                system_message=_SECURITY_SYS,
             )
 
             # Coordinator Agent (User Proxy)
@@ -397,6 +740,7 @@ class AutoGenSelfModificationSystem:
             asyncio.create_task(self._task_execution_loop()),
             asyncio.create_task(self._system_monitoring_loop()),
             asyncio.create_task(self._learning_loop()),
+            asyncio.create_task(self._memory_flush_loop()),
         ]
 
         try:
@@ -404,23 +748,87 @@ class AutoGenSelfModificationSystem:
         except Exception as e:
             logger.error(f"Self-modification system error: {e}")
 
+    def _store_later(self, payload: Dict[str, Any], tier=MemoryTier.LONGTERM):
+        """Queue a memory write for the batched flush loop; a full queue
+        degrades to a fire-and-forget direct write instead of blocking"""
+        try:
+            self._memory_queue.put_nowait((payload, tier))
+        except asyncio.QueueFull:
+            asyncio.create_task(self.memory.store_context(payload, tier=tier))
+
+    async def _memory_flush_loop(self):
+        """Drain queued memory writes in batches of up to 64 events"""
+        # Same bulk-API probe as the error-recovery and integration flush
+        # loops; all three must agree on the backend method name
+        bulk = getattr(self.memory, "store_context_many", None)
+        while True:
+            items = [await self._memory_queue.get()]
+            # Brief coalescing window so closely-spaced events (e.g. a burst
+            # of rollbacks) land in one batch instead of one write each
+            await asyncio.sleep(0.1)
+            while len(items) < 64 and not self._memory_queue.empty():
+                items.append(self._memory_queue.get_nowait())
+
+            try:
+                if bulk is not None:
+                    by_tier: Dict[Any, List[Dict[str, Any]]] = {}
+                    for payload, tier in items:
+                        by_tier.setdefault(tier, []).append(payload)
+                    for tier, payloads in by_tier.items():
+                        await bulk(payloads, tier=tier)
+                else:
+                    # No bulk API on the backend: at least overlap the
+                    # individual round-trips instead of serializing them
+                    await asyncio.gather(
+                        *(
+                            self.memory.store_context(payload, tier=tier)
+                            for payload, tier in items
+                        )
+                    )
+            except Exception as e:
+                logger.error(f"Memory flush failed for {len(items)} events: {e}")
+
+    def _jitter(self, seconds: float) -> float:
+        """Apply +/-10% jitter so the monitoring loops never herd on one tick"""
+        return seconds * self._rng.uniform(0.9, 1.1)
+
     async def _task_generation_loop(self):
         """Continuously generate new modification tasks"""
         while True:
             try:
-                await self._generate_modification_tasks()
-                await asyncio.sleep(self.task_generation_interval)
+                generated = await self._generate_modification_tasks()
+                if generated:
+                    # Work arrived - sample at the base rate again
+                    self._idle_backoff = self.task_generation_interval
+                else:
+                    # Idle - back off exponentially up to twice the base rate
+                    self._idle_backoff = min(
+                        self._idle_backoff * 2, 2 * self.task_generation_interval
+                    )
+                await asyncio.sleep(self._jitter(self._idle_backoff))
             except Exception as e:
                 logger.error(f"Error in task generation loop: {e}")
                 await asyncio.sleep(300)  # Wait 5 minutes on error
 
     async def _task_execution_loop(self):
-        """Execute pending modification tasks"""
+        """Dispatch pending tasks the moment a slot and work are available"""
         while True:
+            await self._slots.acquire()
             try:
-                await self._execute_pending_tasks()
-                await asyncio.sleep(60)  # Check every minute
+                task = await self._heap_pop_async()
+
+                # Move task to active
+                self.active_tasks[task.id] = task
+                for target_file in task.target_files:
+                    self._active_files[target_file] = task.id
+                task.status = "in_progress"
+                self._touch_recent(task)
+
+                # Execute task asynchronously; the slot is released in the
+                # task's finally block
+                asyncio.create_task(self._execute_modification_task(task))
             except Exception as e:
+                self._slots.release()
                 logger.error(f"Error in task execution loop: {e}")
                 await asyncio.sleep(60)
 
@@ -429,7 +837,7 @@ class AutoGenSelfModificationSystem:
         while True:
             try:
                 await self._monitor_for_modification_opportunities()
-                await asyncio.sleep(300)  # Check every 5 minutes
+                await asyncio.sleep(self._jitter(300))  # Check every 5 minutes
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
                 await asyncio.sleep(300)
@@ -440,25 +848,32 @@ class AutoGenSelfModificationSystem:
             try:
                 await self._analyze_modification_outcomes()
                 await self._update_agent_strategies()
-                await asyncio.sleep(1800)  # Every 30 minutes
+                await asyncio.sleep(self._jitter(1800))  # Every 30 minutes
             except Exception as e:
                 logger.error(f"Error in learning loop: {e}")
                 await asyncio.sleep(1800)
 
-    async def _generate_modification_tasks(self):
-        """Generate new modification tasks based on system analysis"""
+    async def _generate_modification_tasks(self) -> int:
+        """Generate new modification tasks; returns how many were queued"""
         try:
-            # Analyze system performance
-            performance_status = await self.performance_tuner.get_performance_status()
-
-            # Analyze error patterns
-            error_status = await self.error_recovery.get_error_recovery_status()
-
-            # Analyze configuration efficiency
-            config_status = await self.config_manager.get_configuration_status()
-
-            # Analyze MCP discovery results
-            discovery_stats = await self.mcp_discovery.get_discovery_stats()
+            # Poll all four subsystems concurrently; a failing source degrades
+            # to an empty status instead of aborting the whole tick
+            statuses = await asyncio.gather(
+                self.performance_tuner.get_performance_status(),
+                self.error_recovery.get_error_recovery_status(),
+                self.config_manager.get_configuration_status(),
+                self.mcp_discovery.get_discovery_stats(),
+                return_exceptions=True,
+            )
+            for source, status in zip(
+                ("performance", "error_recovery", "config", "mcp_discovery"), statuses
+            ):
+                if isinstance(status, Exception):
+                    logger.error(f"Status poll failed for {source}: {status}")
+            performance_status, error_status, config_status, discovery_stats = (
+                status if not isinstance(status, Exception) else {}
+                for status in statuses
+            )
 
             # Generate tasks based on analysis
             new_tasks = []
@@ -483,28 +898,32 @@ class AutoGenSelfModificationSystem:
                 new_tasks.append(self._create_mcp_improvement_task(discovery_stats))
 
             # Add new tasks to queue
+            queued = 0
             for task in new_tasks:
                 if await self._validate_task(task):
-                    self.task_queue.append(task)
+                    self._enqueue_task(task)
+                    queued += 1
 
-                    # Store task in memory
-                    await self.memory.store_context(
-                        {"type": "modification_task_generated", "task": task.__dict__},
-                        tier=MemoryTier.LONGTERM,
+                    # Store task in memory (batched)
+                    self._store_later(
+                        {"type": "modification_task_generated", "task": _serialize_task(task)}
                     )
 
             if new_tasks:
                 logger.info(f"Generated {len(new_tasks)} new modification tasks")
 
+            return queued
+
         except Exception as e:
             logger.error(f"Error generating modification tasks: {e}")
+            return 0
 
     def _create_performance_task(
         self, performance_status: Dict[str, Any]
     ) -> ModificationTask:
         """Create a performance optimization task"""
         return ModificationTask(
-            id=f"perf_{int(time.time())}",
+            id=_new_task_id("perf"),
             task_type=ModificationType.PERFORMANCE_ENHANCEMENT,
             scope=ModificationScope.SUBSYSTEM,
             description=f"Optimize system performance - current health: {performance_status.get('system_health')}",
@@ -531,7 +950,7 @@ class AutoGenSelfModificationSystem:
     ) -> ModificationTask:
         """Create an error resolution task"""
         return ModificationTask(
-            id=f"error_{int(time.time())}",
+            id=_new_task_id("error"),
             task_type=ModificationType.BUG_FIX,
             scope=ModificationScope.MODULE,
             description=f"Resolve recurring errors - {error_status.get('total_errors')} unresolved",
@@ -552,7 +971,7 @@ class AutoGenSelfModificationSystem:
     ) -> ModificationTask:
         """Create a configuration optimization task"""
         return ModificationTask(
-            id=f"config_{int(time.time())}",
+            id=_new_task_id("config"),
             task_type=ModificationType.CONFIGURATION_TUNING,
             scope=ModificationScope.SYSTEM_WIDE,
             description="Optimize system configuration based on usage patterns",
@@ -576,7 +995,7 @@ class AutoGenSelfModificationSystem:
     ) -> ModificationTask:
         """Create an MCP system improvement task"""
         return ModificationTask(
-            id=f"mcp_{int(time.time())}",
+            id=_new_task_id("mcp"),
             task_type=ModificationType.INTEGRATION_ADDITION,
             scope=ModificationScope.SUBSYSTEM,
             description="Improve MCP server integration and discovery",
@@ -595,10 +1014,38 @@ class AutoGenSelfModificationSystem:
             metadata={"trigger": "mcp_inefficiency", "discovery_data": discovery_stats},
         )
 
+    def _enqueue_task(self, task: ModificationTask):
+        """Push a task onto the priority heap and its side indexes"""
+        heapq.heappush(self._task_heap, (task.priority, next(self._task_seq), task.id))
+        self._task_index[task.id] = task
+        self._pending_typescope.add((task.task_type, task.scope))
+        self._seen_task_keys.add(_task_key(task))
+        self._task_available.set()
+        self._status_dirty = True
+
+    def _dequeue_task(self) -> Optional[ModificationTask]:
+        """Pop the highest-priority pending task, skipping stale heap entries"""
+        while self._task_heap:
+            _, _, task_id = heapq.heappop(self._task_heap)
+            task = self._task_index.pop(task_id, None)
+            if task is not None:
+                self._pending_typescope.discard((task.task_type, task.scope))
+                self._status_dirty = True
+                return task
+        return None
+
     async def _validate_task(self, task: ModificationTask) -> bool:
         """Validate if a task should be added to the queue"""
-        # Check if similar task already exists
-        for existing_task in self.task_queue + list(self.active_tasks.values()):
+        # Check if similar task already exists (pending set is O(1))
+        if (task.task_type, task.scope) in self._pending_typescope:
+            return False
+
+        # Bloom check blocks re-generating a fix identical to one already
+        # enqueued at any point, without scanning historical tasks
+        if _task_key(task) in self._seen_task_keys:
+            return False
+
+        for existing_task in self.active_tasks.values():
             if (
                 existing_task.task_type == task.task_type
                 and existing_task.scope == task.scope
@@ -607,39 +1054,23 @@ class AutoGenSelfModificationSystem:
                 return False
 
         # Check if files are currently being modified
-        for active_task in self.active_tasks.values():
-            if any(file in active_task.target_files for file in task.target_files):
-                return False
+        if not self._active_files.keys().isdisjoint(task.target_files):
+            return False
 
         return True
 
-    async def _execute_pending_tasks(self):
-        """Execute pending modification tasks"""
-        if len(self.active_tasks) >= self.max_concurrent_modifications:
-            return
-
-        # Sort tasks by priority
-        self.task_queue.sort(key=lambda t: (t.priority, t.created_at))
-
-        # Execute highest priority tasks
-        for task in self.task_queue[
-            : self.max_concurrent_modifications - len(self.active_tasks)
-        ]:
-            try:
-                # Move task to active
-                self.task_queue.remove(task)
-                self.active_tasks[task.id] = task
-                task.status = "in_progress"
-
-                # Execute task asynchronously
-                asyncio.create_task(self._execute_modification_task(task))
-
-            except Exception as e:
-                logger.error(f"Error starting task execution {task.id}: {e}")
-                task.status = "failed"
+    async def _heap_pop_async(self) -> ModificationTask:
+        """Wait for the next pending task without a polling sleep"""
+        while True:
+            task = self._dequeue_task()
+            if task is not None:
+                return task
+            self._task_available.clear()
+            await self._task_available.wait()
 
     async def _execute_modification_task(self, task: ModificationTask):
         """Execute a specific modification task"""
+        team_key = None
         try:
             logger.info(f"Executing modification task: {task.id} - {task.description}")
 
@@ -653,8 +1084,12 @@ class AutoGenSelfModificationSystem:
                     logger.warning(f"Task {task.id} failed safety checks")
                     return
 
-            # Get appropriate agent team
-            team = self._select_agent_team(task)
+            # Get appropriate agent team and record the best-matching agent
+            team_key = self._select_team_key(task)
+            team = self.agent_teams.get(team_key)
+            task.assigned_agents = [self._best_agent_for(task)]
+            if self._team_load is not None:
+                self._team_load[self._team_slot[team_key]] += 1.0
 
             if team and AUTOGEN_AVAILABLE:
                 # Execute with AutoGen agents
@@ -672,7 +1107,7 @@ class AutoGenSelfModificationSystem:
 
                 if verification_result:
                     task.status = "completed"
-                    self.completed_tasks.append(task)
+                    self._archive_completed(task)
                     logger.info(f"Task {task.id} completed successfully")
                 else:
                     task.status = "failed"
@@ -684,10 +1119,9 @@ class AutoGenSelfModificationSystem:
                 if self.auto_rollback_on_failure:
                     await self._rollback_modifications(task)
 
-            # Store task completion
-            await self.memory.store_context(
-                {"type": "modification_task_completed", "task": task.__dict__},
-                tier=MemoryTier.LONGTERM,
+            # Store task completion (batched)
+            self._store_later(
+                {"type": "modification_task_completed", "task": _serialize_task(task)}
             )
 
         except Exception as e:
@@ -698,25 +1132,52 @@ class AutoGenSelfModificationSystem:
             # Remove from active tasks
             if task.id in self.active_tasks:
                 del self.active_tasks[task.id]
+            for target_file in task.target_files:
+                if self._active_files.get(target_file) == task.id:
+                    del self._active_files[target_file]
+            self._touch_recent(task)
+            if team_key is not None and self._team_load is not None:
+                self._team_load[self._team_slot[team_key]] -= 1.0
+            self._slots.release()
+
+    def _touch_recent(self, task: ModificationTask):
+        """Move a task to the front of the bounded recent-tasks view"""
+        try:
+            self._recent_tasks.remove(task)
+        except ValueError:
+            pass
+        self._recent_tasks.appendleft(task)
+        self._status_dirty = True
+
+    def _archive_completed(self, task: ModificationTask):
+        """Append to the bounded completed list, flushing the evictee to
+        long-term memory before the deque drops it"""
+        if len(self.completed_tasks) == self.completed_tasks.maxlen:
+            evicted = self.completed_tasks[0]
+            self._store_later(
+                {"type": "modification_task_archived", "task": _serialize_task(evicted)}
+            )
+        self.completed_tasks.append(task)
+
+    def _select_team_key(self, task: ModificationTask) -> str:
+        """Pick a team key via load-aware softmax over team affinities"""
+        preferred = self._type_to_team_key.get(task.task_type, "architecture")
+        if self._team_load is None:
+            return preferred
+
+        # Affinity boost for the preferred team minus in-flight load; the
+        # softmax keeps the preferred team dominant while letting a saturated
+        # team shed work to idle ones instead of queueing behind it
+        scores = -self._team_load.copy()
+        scores[self._team_slot[preferred]] += 2.0
+        probs = np.exp(scores - scores.max())
+        probs /= probs.sum()
+        choice = int(np.searchsorted(np.cumsum(probs), self._rng.random()))
+        return self._team_keys[min(choice, len(self._team_keys) - 1)]
 
     def _select_agent_team(self, task: ModificationTask) -> Optional[Any]:
         """Select appropriate agent team for task"""
-        if task.task_type in [
-            ModificationType.ARCHITECTURE_REFINEMENT,
-            ModificationType.NEW_FEATURE_ADDITION,
-        ]:
-            return self.agent_teams.get("architecture")
-        elif task.task_type in [
-            ModificationType.PERFORMANCE_ENHANCEMENT,
-            ModificationType.CODE_OPTIMIZATION,
-        ]:
-            return self.agent_teams.get("performance")
-        elif task.task_type == ModificationType.BUG_FIX:
-            return self.agent_teams.get("debugging")
-        elif task.task_type == ModificationType.CONFIGURATION_TUNING:
-            return self.agent_teams.get("configuration")
-        else:
-            return self.agent_teams.get("architecture")  # Default team
+        return self.agent_teams.get(self._select_team_key(task))
 
     async def _execute_with_agents(self, task: ModificationTask, team: Any) -> bool:
         """Execute task with AutoGen agents"""
@@ -751,10 +1212,8 @@ class AutoGenSelfModificationSystem:
         await asyncio.sleep(2)  # Simulate work
 
         # Simulate success/failure based on complexity
-        import random
-
         success_probability = max(0.3, 1.0 - (task.estimated_complexity / 15))
-        return random.random() < success_probability
+        return self._rng.random() < success_probability
 
     def _analyze_agent_result(self, result: Any, task: ModificationTask) -> bool:
         """Analyze the result from agent execution"""
@@ -762,32 +1221,57 @@ class AutoGenSelfModificationSystem:
         # For now, simulate based on agent feedback
         return True  # Assume success for simulation
 
+    async def _cached_error_status(self, ttl: float = 1.0) -> Dict[str, Any]:
+        """Error-recovery status behind a short TTL; emergency-mode flips
+        are rare, so a burst of admissions shares one lookup"""
+        ts, status = self._err_status_cache
+        now = time.monotonic()
+        if status is None or now - ts > ttl:
+            status = await self.error_recovery.get_error_recovery_status()
+            self._err_status_cache = (now, status)
+        return status
+
     async def _perform_safety_checks(self, task: ModificationTask) -> bool:
         """Perform safety checks before executing task"""
-        # Check system resources
-        import psutil
-
-        if psutil.cpu_percent() > 90 or psutil.virtual_memory().percent > 95:
-            logger.warning("System resources too high for modification")
+        # Cheapest check first: file conflicts are pure dict lookups and
+        # reject most bad dispatches before any await or syscall
+        conflict = next(
+            (f for f in task.target_files if self._active_files.get(f) not in (None, task.id)),
+            None,
+        )
+        if conflict is not None:
+            logger.warning(
+                f"File conflict with active task {self._active_files[conflict]}"
+            )
             return False
 
-        # Check for critical errors
-        error_status = await self.error_recovery.get_error_recovery_status()
+        # Check for critical errors (TTL-cached lookup)
+        error_status = await self._cached_error_status()
         if error_status.get("emergency_mode_active", False):
             logger.warning("Emergency mode active - blocking modifications")
             return False
 
-        # Check for conflicting tasks
-        for active_task in self.active_tasks.values():
-            if any(file in active_task.target_files for file in task.target_files):
-                logger.warning(f"File conflict with active task {active_task.id}")
-                return False
+        # Most expensive last: system resources (TTL-cached snapshot)
+        cpu, mem = await _get_resource_snapshot()
+        if cpu > 90 or mem > 95:
+            logger.warning("System resources too high for modification")
+            return False
 
         return True
 
     async def _verify_modifications(self, task: ModificationTask) -> bool:
         """Verify that modifications were successful"""
         try:
+            # Syntax-gate the modified sources before spending time on tests;
+            # the parse is cached so unchanged shared targets cost one lookup
+            for file_path in task.target_files:
+                if Path(file_path).exists():
+                    try:
+                        _parse_target(file_path)
+                    except SyntaxError as e:
+                        logger.error(f"Modified file fails to parse: {file_path}: {e}")
+                        return False
+
             # Run tests if available
             test_results = await self._run_tests(task)
             task.test_results = test_results
@@ -799,32 +1283,120 @@ class AutoGenSelfModificationSystem:
             logger.error(f"Error verifying modifications: {e}")
             return False
 
-    async def _run_tests(self, task: ModificationTask) -> Dict[str, bool]:
-        """Run tests for the modified components"""
-        test_results = {}
+    async def _get_pytest_worker(self):
+        """Lazily (re)start the persistent pytest worker process"""
+        if self._pytest_worker is None or self._pytest_worker.returncode is not None:
+            self._pytest_worker = await asyncio.create_subprocess_exec(
+                "python",
+                "-u",
+                "-c",
+                _PYTEST_WORKER_SRC,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        return self._pytest_worker
 
-        try:
-            # Run relevant tests based on target files
-            for file_path in task.target_files:
-                if "test" in file_path:
-                    continue
+    def _kill_pytest_worker(self):
+        """Discard the worker process; the next run respawns it"""
+        if self._pytest_worker is not None:
+            self._pytest_worker.kill()
+            self._pytest_worker = None
 
-                # Find corresponding test file
-                test_file = file_path.replace("src/", "tests/").replace(
-                    ".py", "_test.py"
-                )
+    async def _run_single_test(self, test_file: str) -> bool:
+        """Run one pytest file, preferring the warm worker process"""
+        async with self._pytest_worker_lock:
+            try:
+                worker = await self._get_pytest_worker()
+                worker.stdin.write(test_file.encode() + b"\n")
+                await worker.stdin.drain()
+                line = await asyncio.wait_for(worker.stdout.readline(), timeout=300)
+                if line.startswith(b"RESULT "):
+                    return int(line.split()[1]) == 0
+                raise ValueError(f"unexpected worker reply: {line!r}")
+            except asyncio.CancelledError:
+                # Cancelled mid-request (fail-fast path): the worker still
+                # owes a RESULT line that would be misread as the reply to
+                # the next request, so the process cannot be reused
+                self._kill_pytest_worker()
+                raise
+            except Exception as e:
+                logger.warning(f"pytest worker failed, cold-spawning instead: {e}")
+                self._kill_pytest_worker()
+
+        return await self._run_test_cold(test_file)
+
+    async def _run_test_cold(self, test_file: str) -> bool:
+        """Fallback: run one pytest file in a fresh child process"""
+        async with self._test_slots:
+            # Only the exit code matters, so the child's output goes to
+            # DEVNULL instead of being piped, buffered and decoded
+            proc = await asyncio.create_subprocess_exec(
+                "python",
+                "-m",
+                "pytest",
+                test_file,
+                "-q",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=300)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return False
+            return proc.returncode == 0
 
-                if Path(test_file).exists():
-                    # Run specific test
-                    result = subprocess.run(
-                        ["python", "-m", "pytest", test_file, "-v"],
-                        capture_output=True,
-                        text=True,
-                        timeout=300,
-                    )
-                    test_results[test_file] = result.returncode == 0
+    def _available_tests(self) -> set:
+        """Discovered *_test.py paths, rescanned only when tests/ changes"""
+        try:
+            mtime = os.stat("tests").st_mtime_ns
+        except OSError:
+            return set()
+        if mtime != self._tests_dir_mtime:
+            self._test_index = {str(p) for p in Path("tests").rglob("*_test.py")}
+            self._tests_dir_mtime = mtime
+        return self._test_index
 
-            return test_results
+    async def _run_tests(self, task: ModificationTask) -> Dict[str, bool]:
+        """Run tests for the modified components"""
+        try:
+            # Find corresponding test files for the modified sources
+            available = self._available_tests()
+            test_files = [
+                _to_test_path(file_path)
+                for file_path in task.target_files
+                if "test" not in file_path
+            ]
+            test_files = [f for f in test_files if f in available]
+
+            # Create all runners up front, but note the warm worker handles
+            # one request at a time over its single pipe, so files only run
+            # in parallel on the cold-spawn fallback. Fail fast either way:
+            # verification needs every file green, so the first failure
+            # cancels the queued runners instead of letting them complete
+            runners = {
+                asyncio.create_task(self._run_single_test(test_file)): test_file
+                for test_file in test_files
+            }
+            results: Dict[str, bool] = {}
+            pending = set(runners)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                failed = False
+                for runner in done:
+                    passed = runner.exception() is None and runner.result() is True
+                    results[runners[runner]] = passed
+                    failed = failed or not passed
+                if failed and pending:
+                    for runner in pending:
+                        runner.cancel()
+                    results.update((runners[r], False) for r in pending)
+                    break
+            return results
 
         except Exception as e:
             logger.error(f"Error running tests: {e}")
@@ -836,13 +1408,10 @@ class AutoGenSelfModificationSystem:
 
         try:
             # This would implement actual rollback logic
-            # For now, simulate rollback
-            await asyncio.sleep(1)
-
             task.status = "rolled_back"
 
-            # Store rollback event
-            await self.memory.store_context(
+            # Store rollback event (batched)
+            self._store_later(
                 {
                     "type": "modification_rollback",
                     "task_id": task.id,
@@ -856,11 +1425,23 @@ class AutoGenSelfModificationSystem:
 
     async def get_self_modification_status(self) -> Dict[str, Any]:
         """Get current self-modification system status"""
-        return {
+        # Steady-state polls return the memoized payload untouched; any task
+        # or agent mutation flips the dirty flag and forces a rebuild
+        if not self._status_dirty and self._status_payload_cache is not None:
+            return self._status_payload_cache
+
+        # Capabilities only change on (de)registration, so the view is built
+        # once and reused across status polls
+        if self._agent_caps_view is None:
+            self._agent_caps_view = {
+                name: cap.specializations
+                for name, cap in self.agent_capabilities.items()
+            }
+        payload = {
             "autogen_available": AUTOGEN_AVAILABLE,
             "agents_initialized": len(self.agents),
             "active_tasks": len(self.active_tasks),
-            "queued_tasks": len(self.task_queue),
+            "queued_tasks": len(self._task_index),
             "completed_tasks": len(self.completed_tasks),
             "safety_checks_enabled": self.safety_checks_enabled,
             "recent_tasks": [
@@ -868,17 +1449,13 @@ class AutoGenSelfModificationSystem:
                     "id": task.id,
                     "type": task.task_type.value,
                     "status": task.status,
-                    "created_at": task.created_at.isoformat(),
+                    "created_at": task.created_at_iso,
                 }
-                for task in sorted(
-                    self.completed_tasks + list(self.active_tasks.values()),
-                    key=lambda t: t.created_at,
-                    reverse=True,
-                )[:10]
+                for task in self._recent_tasks
             ],
-            "agent_capabilities": {
-                name: cap.specializations
-                for name, cap in self.agent_capabilities.items()
-            },
+            "agent_capabilities": self._agent_caps_view,
             "system_learning_enabled": True,
         }
+        self._status_payload_cache = payload
+        self._status_dirty = False
+        return payload
@@ -4,17 +4,25 @@ Automatically detects, diagnoses, and resolves system issues
 """
 
 import asyncio
-import json
+import functools
+import os
+import re
+import sys
 import time
 import traceback
+import types
+from hashlib import blake2b
 from datetime import datetime, timedelta
+from collections import Counter, deque
 from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-import logging
-import subprocess
-import sys
-from pathlib import Path
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 from ..config.settings import Settings
 from ..memory.enhanced_memory import EnhancedMemoryManager, MemoryTier
@@ -35,6 +43,26 @@ class ErrorSeverity(str, Enum):
     LOW = "low"  # Minor issues
 
 
+# Attach ordinal ranks to the members so severity comparisons are plain
+# int compares (sev_a.rank <= sev_b.rank) with no dict lookup
+for _sev, _rank in zip(
+    (ErrorSeverity.LOW, ErrorSeverity.MEDIUM, ErrorSeverity.HIGH,
+     ErrorSeverity.CRITICAL),
+    (1, 2, 3, 4),
+):
+    _sev.rank = _rank
+
+# Severity escalation for recurring errors: one table lookup, no branching
+_ESCALATE = types.MappingProxyType(
+    {
+        ErrorSeverity.LOW: ErrorSeverity.MEDIUM,
+        ErrorSeverity.MEDIUM: ErrorSeverity.HIGH,
+        ErrorSeverity.HIGH: ErrorSeverity.CRITICAL,
+        ErrorSeverity.CRITICAL: ErrorSeverity.CRITICAL,
+    }
+)
+
+
 class ErrorCategory(str, Enum):
     """Categories of errors"""
 
@@ -50,6 +78,87 @@ class ErrorCategory(str, Enum):
     RESOURCE_EXHAUSTION = "resource_exhaustion"
 
 
+@functools.lru_cache(maxsize=4096)
+def _message_fingerprint(message: str) -> str:
+    """Stable 64-bit fingerprint of an error message.
+
+    blake2b is process-stable (builtin hash() is randomized per run) and
+    the cache means error storms repeating one message skip hashing.
+    """
+    return blake2b(message.encode("utf-8", "replace"), digest_size=8).hexdigest()
+
+
+# Stack traces can run to tens of KB during storms; keep only the tail
+# (the frames closest to the raise site) to bound string churn
+_MAX_TRACE = 4096
+
+
+def _trim_trace(tb: str) -> str:
+    """Truncate a formatted traceback to its last _MAX_TRACE characters"""
+    return tb if len(tb) <= _MAX_TRACE else tb[-_MAX_TRACE:]
+
+
+# One compiled alternation per severity/category tier: the regex engine
+# scans the lowered message once in C instead of k Python substring tests.
+# Tuple order preserves the original if/elif precedence.
+_SEVERITY_PATTERNS = (
+    (ErrorSeverity.CRITICAL, re.compile(r"critical|fatal|system failure|crash")),
+    (ErrorSeverity.HIGH, re.compile(r"connection|timeout|authentication|permission")),
+    (ErrorSeverity.MEDIUM, re.compile(r"error|failed|exception")),
+)
+
+_CATEGORY_PATTERNS = (
+    (ErrorCategory.PROVIDER_FAILURE, re.compile(r"provider|completion")),
+    (ErrorCategory.MEMORY_SYSTEM, re.compile(r"memory|cache")),
+    (ErrorCategory.MCP_SERVER, re.compile(r"mcp|server")),
+    (ErrorCategory.DATABASE_CONNECTION, re.compile(r"database|sql")),
+    (ErrorCategory.NETWORK_TIMEOUT, re.compile(r"timeout|network")),
+    (ErrorCategory.CONFIGURATION, re.compile(r"config|setting")),
+    (ErrorCategory.DEPENDENCY_MISSING, re.compile(r"dependency|import")),
+    (ErrorCategory.PERFORMANCE_DEGRADATION, re.compile(r"performance|slow")),
+    (ErrorCategory.AUTHENTICATION, re.compile(r"auth|token")),
+    (ErrorCategory.RESOURCE_EXHAUSTION, re.compile(r"memory|disk|resource")),
+)
+
+# Optional Aho-Corasick rung: one C-level pass over the message instead of
+# up to ten regex scans. Payloads carry the tier rank so precedence matches
+# the pattern-table order exactly.
+_CATEGORY_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    _CATEGORY_AUTOMATON = ahocorasick.Automaton()
+    for _rank, (_category, _pattern) in enumerate(_CATEGORY_PATTERNS):
+        for _keyword in _pattern.pattern.split("|"):
+            # Keep the lowest (highest-precedence) rank for shared keywords
+            if _keyword not in _CATEGORY_AUTOMATON:
+                _CATEGORY_AUTOMATON.add_word(_keyword, (_rank, _category))
+    _CATEGORY_AUTOMATON.make_automaton()
+
+
+@functools.lru_cache(maxsize=2048)
+def _severity_for(message_prefix: str) -> ErrorSeverity:
+    """Memoized severity lookup; storms repeat identical messages, so most
+    calls are cache hits. Keyed on a lowered, truncated prefix."""
+    for severity, pattern in _SEVERITY_PATTERNS:
+        if pattern.search(message_prefix):
+            return severity
+    return ErrorSeverity.LOW
+
+
+@functools.lru_cache(maxsize=2048)
+def _category_for(message_prefix: str) -> ErrorCategory:
+    """Memoized category lookup, same keying as _severity_for"""
+    if _CATEGORY_AUTOMATON is not None:
+        best = min(
+            (payload for _, payload in _CATEGORY_AUTOMATON.iter(message_prefix)),
+            default=None,
+        )
+        return best[1] if best else ErrorCategory.CONFIGURATION
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(message_prefix):
+            return category
+    return ErrorCategory.CONFIGURATION
+
+
 class RecoveryAction(str, Enum):
     """Available recovery actions"""
 
@@ -65,7 +174,19 @@ class RecoveryAction(str, Enum):
     RESTART_COMPONENT = "restart_component"
 
 
-@dataclass
+# One bit per recovery action: an event's taken-set is a single int with
+# O(1) set/test instead of a list of strings
+_ACTION_BIT = types.MappingProxyType(
+    {action: 1 << i for i, action in enumerate(RecoveryAction)}
+)
+
+
+def _decode_actions(mask: int) -> List[str]:
+    """Expand an actions_taken_mask back into action value strings"""
+    return [action.value for action, bit in _ACTION_BIT.items() if mask & bit]
+
+
+@dataclass(slots=True)
 class ErrorEvent:
     """Represents an error event"""
 
@@ -80,11 +201,25 @@ class ErrorEvent:
     metadata: Dict[str, Any] = field(default_factory=dict)
     resolved: bool = False
     resolution_timestamp: Optional[datetime] = None
-    recovery_actions_taken: List[str] = field(default_factory=list)
+    actions_taken_mask: int = 0  # Bitmask over _ACTION_BIT; see _decode_actions
     recurrence_count: int = 1
+    # Memoized isoformat of timestamp; recomputed only when timestamp moves
+    _iso: str = field(init=False, default="", repr=False)
+    _iso_for: Optional[datetime] = field(init=False, default=None, repr=False)
+
+    def iso_timestamp(self) -> str:
+        """isoformat() of the current timestamp, cached between changes.
+
+        Status dashboards poll far more often than events recur, so the
+        string formatting usually amortizes to a single attribute read.
+        """
+        if self._iso_for is not self.timestamp:
+            self._iso_for = self.timestamp
+            self._iso = self.timestamp.isoformat()
+        return self._iso
 
 
-@dataclass
+@dataclass(slots=True)
 class RecoveryRule:
     """Rule for automatic error recovery"""
 
@@ -98,9 +233,90 @@ class RecoveryRule:
     cooldown_minutes: int = 10
     success_rate_threshold: float = 0.7  # Minimum success rate to keep using this rule
     enabled: bool = True
+    sequential: bool = False  # Actions depend on each other; run in order
     last_used: Optional[datetime] = None
     success_count: int = 0
     failure_count: int = 0
+    _compiled: Optional[re.Pattern] = field(init=False, default=None, repr=False)
+    # Monotonic twin of last_used - cooldown math without datetime arithmetic
+    # and immune to wall-clock jumps
+    _last_used_monotonic: float = field(init=False, default=0.0, repr=False)
+
+    def __post_init__(self):
+        # Compile once at rule creation; matching is then a C-level search
+        if self.error_pattern:
+            self._compiled = re.compile(self.error_pattern, re.IGNORECASE)
+
+
+# Static specs for the default rule set, evaluated once at import time.
+# Instances stay per-system because rules accumulate mutable stats.
+_DEFAULT_RULE_SPECS: Tuple[Dict[str, Any], ...] = (
+    # Provider failure recovery
+    dict(
+        name="provider_timeout_failover",
+        error_pattern=r"timeout.*provider",
+        category=ErrorCategory.PROVIDER_FAILURE,
+        severity=ErrorSeverity.HIGH,
+        actions=[
+            RecoveryAction.FAILOVER_PROVIDER,
+            RecoveryAction.RESET_CONNECTION,
+        ],
+        cooldown_minutes=5,
+    ),
+    # Memory system recovery
+    dict(
+        name="memory_cache_clear",
+        error_pattern=r"memory|cache",
+        category=ErrorCategory.MEMORY_SYSTEM,
+        severity=ErrorSeverity.MEDIUM,
+        actions=[RecoveryAction.CLEAR_CACHE, RecoveryAction.SCALE_RESOURCES],
+        cooldown_minutes=10,
+    ),
+    # Database connection recovery
+    dict(
+        name="database_reconnect",
+        error_pattern=r"database|connection.*lost",
+        category=ErrorCategory.DATABASE_CONNECTION,
+        severity=ErrorSeverity.HIGH,
+        actions=[
+            RecoveryAction.RESET_CONNECTION,
+            RecoveryAction.RESTART_SERVICE,
+        ],
+        cooldown_minutes=5,
+    ),
+    # MCP server recovery
+    dict(
+        name="mcp_server_switch",
+        error_pattern=r"mcp.*server|tool.*failed",
+        category=ErrorCategory.MCP_SERVER,
+        severity=ErrorSeverity.MEDIUM,
+        actions=[
+            RecoveryAction.SWITCH_MCP_SERVER,
+            RecoveryAction.RESTART_COMPONENT,
+        ],
+        cooldown_minutes=15,
+    ),
+    # Performance degradation recovery
+    dict(
+        name="performance_optimization",
+        error_pattern=r"slow|performance|degradation",
+        category=ErrorCategory.PERFORMANCE_DEGRADATION,
+        severity=ErrorSeverity.MEDIUM,
+        actions=[RecoveryAction.SCALE_RESOURCES, RecoveryAction.CLEAR_CACHE],
+        cooldown_minutes=20,
+    ),
+    # Critical system recovery
+    dict(
+        name="critical_emergency_mode",
+        error_pattern=r"critical|fatal|system.*failure",
+        category=ErrorCategory.PROVIDER_FAILURE,  # Any category for critical errors
+        severity=ErrorSeverity.CRITICAL,
+        actions=[RecoveryAction.EMERGENCY_MODE, RecoveryAction.ROLLBACK_CONFIG],
+        cooldown_minutes=30,
+        max_attempts=1,
+        sequential=True,  # Enter emergency mode before touching config
+    ),
+)
 
 
 class ErrorRecoverySystem:
@@ -122,43 +338,115 @@ class ErrorRecoverySystem:
         self.config_manager = config_manager
         self.mcp_installer = MCPServerInstaller(settings)
 
-        # Error tracking
+        # Error tracking. The event store is bounded: once full, the least
+        # recently touched signature is evicted so a busy system stays
+        # memory-flat between hourly cleanups
         self.error_events: Dict[str, ErrorEvent] = {}
-        self.error_patterns: Dict[str, int] = {}  # Track frequency of error patterns
+        self.max_error_events = 10_000
+        self._evicted_errors = 0
+        # Running counters and a bounded recent-events view so status calls
+        # never walk or sort the event store
+        self._resolved_count = 0
+        self._recent_events: deque = deque(maxlen=10)
+        # Short-TTL snapshot so bursts of dashboard pollers share one build
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._status_ttl = 0.5
+        # Pattern frequencies as a Counter: most_common(k) is a heap-based
+        # partial sort and the analysis loop decays counts to bound growth
+        self.error_patterns: Counter = Counter()
         self.recovery_history: List[Dict[str, Any]] = []
 
         # Recovery configuration
+        self._simulate_latency = os.getenv("EZZINV_SIMULATE_RECOVERY") == "1"
         self.max_concurrent_recoveries = 3
         self.error_detection_interval = 30  # seconds
         self.error_retention_days = 30
         self.emergency_mode_active = False
 
-        # Component health tracking
+        # Component health tracking. Status reads hand out the read-only
+        # proxy so callers cannot mutate internal state through a snapshot
         self.component_health: Dict[str, Dict[str, Any]] = {}
+        self._component_health_view = types.MappingProxyType(self.component_health)
         self.last_health_check = datetime.now()
 
-        # Initialize recovery rules
+        # Initialize recovery rules, indexed by category so matching scans
+        # only the rules that can possibly apply
         self.recovery_rules = self._create_recovery_rules()
+        self.rules_by_category: Dict[ErrorCategory, List[RecoveryRule]] = {}
+        for rule in self.recovery_rules:
+            self.rules_by_category.setdefault(rule.category, []).append(rule)
+        # Pre-sort each category by priority once - the sort keys are rule
+        # constants, so matching never has to sort on the hot path
+        for rules in self.rules_by_category.values():
+            rules.sort(key=lambda r: (r.success_rate_threshold, -len(r.actions)))
+        # Expand into a (category, severity) index holding only the rules
+        # whose severity requirement the key severity satisfies; matching
+        # then needs zero per-call severity comparisons
+        self._rule_index: Dict[
+            Tuple[ErrorCategory, ErrorSeverity], List[RecoveryRule]
+        ] = {}
+        for category, rules in self.rules_by_category.items():
+            for severity in ErrorSeverity:
+                candidates = [r for r in rules if r.severity.rank <= severity.rank]
+                if candidates:
+                    self._rule_index[(category, severity)] = candidates
+
+        # Rules never toggle enabled at runtime today; cache the count
+        self._enabled_rules_count = sum(1 for r in self.recovery_rules if r.enabled)
+
+        # O(1) action dispatch table; the handlers normalize on the event
+        # so _execute_recovery_action needs no per-action argument logic
+        self._action_dispatch: Dict[RecoveryAction, Callable] = {
+            RecoveryAction.RESTART_SERVICE: lambda ev: self._restart_service(
+                ev.component
+            ),
+            RecoveryAction.FAILOVER_PROVIDER: self._failover_provider,
+            RecoveryAction.CLEAR_CACHE: lambda ev: self._clear_cache(ev.component),
+            RecoveryAction.RESET_CONNECTION: lambda ev: self._reset_connection(
+                ev.component
+            ),
+            RecoveryAction.INSTALL_DEPENDENCY: self._install_dependency,
+            RecoveryAction.ROLLBACK_CONFIG: self._rollback_config,
+            RecoveryAction.SCALE_RESOURCES: self._scale_resources,
+            RecoveryAction.SWITCH_MCP_SERVER: self._switch_mcp_server,
+            RecoveryAction.EMERGENCY_MODE: lambda ev: self._activate_emergency_mode(),
+            RecoveryAction.RESTART_COMPONENT: lambda ev: self._restart_component(
+                ev.component
+            ),
+        }
 
         # Active recovery tasks
         self.active_recoveries: Dict[str, asyncio.Task] = {}
 
+        # Write-behind analytics queue: error storms enqueue cheaply here
+        # and the flush loop batches the round-trips to the backend
+        self._analytics_queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+
+        # Long-lived probe clients, created lazily and reused across health
+        # ticks; reconstructing them per probe paid connection setup every
+        # time. Reset to None on failure to force a clean reconnect.
+        self._probe_engine = None
+        self._probe_redis = None
+        self._probe_mongo = None
+        self._db_status_cache: tuple = (0.0, None)
+        self._chat_system = None
+        self._mcp_manager = None
+
     async def start_error_monitoring(self):
         """Start continuous error monitoring and recovery"""
         logger.info("Starting error recovery system...")
 
-        # Start monitoring loops
-        monitor_tasks = [
-            asyncio.create_task(self._error_detection_loop()),
-            asyncio.create_task(self._health_check_loop()),
-            asyncio.create_task(self._recovery_cleanup_loop()),
-            asyncio.create_task(self._pattern_analysis_loop()),
-        ]
-
+        # TaskGroup cancels the sibling loops when one fails, so a crashed
+        # monitor never leaves the others running unsupervised
         try:
-            await asyncio.gather(*monitor_tasks)
-        except Exception as e:
-            logger.error(f"Error monitoring system failed: {e}")
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._error_detection_loop())
+                tg.create_task(self._health_check_loop())
+                tg.create_task(self._recovery_cleanup_loop())
+                tg.create_task(self._pattern_analysis_loop())
+                tg.create_task(self._analytics_flush_loop())
+        except* Exception as eg:
+            logger.error(f"Error monitoring system failed: {eg.exceptions}")
             await self._initiate_emergency_recovery()
 
     async def _error_detection_loop(self):
@@ -192,10 +480,19 @@ class ErrorRecoverySystem:
                 logger.error(f"Error in cleanup loop: {e}")
                 await asyncio.sleep(3600)
 
+    def _decay_error_patterns(self):
+        """Exponentially decay pattern counts so stale signatures age out
+        and the counter stays memory-bounded"""
+        self.error_patterns = Counter(
+            {sig: decayed for sig, count in self.error_patterns.items()
+             if (decayed := int(count * 0.9)) >= 1}
+        )
+
     async def _pattern_analysis_loop(self):
         """Analyze error patterns and optimize recovery rules"""
         while True:
             try:
+                self._decay_error_patterns()
                 await self._analyze_error_patterns()
                 await self._optimize_recovery_rules()
                 await asyncio.sleep(1800)  # Every 30 minutes
@@ -203,6 +500,38 @@ class ErrorRecoverySystem:
                 logger.error(f"Error in pattern analysis loop: {e}")
                 await asyncio.sleep(1800)
 
+    def _store_analytics(self, payload: Dict[str, Any]):
+        """Queue an analytics record for the batched flush loop; a full
+        queue drops the record rather than stalling error processing"""
+        try:
+            self._analytics_queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("Analytics queue full - dropping record")
+
+    async def _analytics_flush_loop(self):
+        """Drain queued analytics records in batches"""
+        bulk = getattr(self.memory, "store_context_many", None)
+        while True:
+            try:
+                items = [await self._analytics_queue.get()]
+                # Coalescing window so a storm shares one batched write
+                await asyncio.sleep(0.5)
+                while len(items) < 256 and not self._analytics_queue.empty():
+                    items.append(self._analytics_queue.get_nowait())
+
+                if bulk is not None:
+                    await bulk(items, tier=MemoryTier.ANALYTICS)
+                else:
+                    await asyncio.gather(
+                        *(
+                            self.memory.store_context(item, tier=MemoryTier.ANALYTICS)
+                            for item in items
+                        )
+                    )
+            except Exception as e:
+                logger.error(f"Error flushing analytics records: {e}")
+                await asyncio.sleep(5)
+
     async def _scan_for_errors(self):
         """Scan system for errors"""
         # Check recent log entries for errors
@@ -225,6 +554,8 @@ class ErrorRecoverySystem:
                 minutes=5, metrics=["error", "exception", "failure"]
             )
 
+            # One timestamp for the whole batch of log-derived events
+            now = datetime.now()
             for log_entry in recent_logs:
                 if log_entry.get("error") or log_entry.get("exception"):
                     await self._process_error_event(
@@ -233,6 +564,7 @@ class ErrorRecoverySystem:
                         stack_trace=log_entry.get("stack_trace", ""),
                         component=log_entry.get("component", "unknown"),
                         metadata=log_entry,
+                        now=now,
                     )
 
         except Exception as e:
@@ -248,34 +580,43 @@ class ErrorRecoverySystem:
             "cache": self._check_cache_system,
         }
 
-        for component, check_func in components.items():
-            try:
-                status = await check_func()
-                self.component_health[component] = {
-                    "status": status,
-                    "last_check": datetime.now(),
-                    "consecutive_failures": (
-                        0
-                        if status["healthy"]
-                        else self.component_health.get(component, {}).get(
-                            "consecutive_failures", 0
-                        )
-                        + 1
-                    ),
-                }
-
-                # Trigger recovery if component is unhealthy
-                if not status["healthy"]:
-                    await self._process_component_failure(component, status)
-
-            except Exception as e:
-                logger.error(f"Error checking component {component}: {e}")
+        # Run all health checks concurrently: they are independent and
+        # network-bound, so wall time is the slowest check, not the sum
+        results = await asyncio.gather(
+            *(check_func() for check_func in components.values()),
+            return_exceptions=True,
+        )
+
+        # One timestamp per check tick, shared by every component record
+        now = datetime.now()
+        for component, status in zip(components, results):
+            if isinstance(status, Exception):
+                logger.error(f"Error checking component {component}: {status}")
                 await self._process_error_event(
                     error_type="component_check_failure",
-                    error_message=f"Failed to check {component}: {str(e)}",
-                    stack_trace=traceback.format_exc(),
+                    error_message=f"Failed to check {component}: {status}",
+                    stack_trace="".join(traceback.format_exception(status)),
                     component=component,
+                    now=now,
                 )
+                continue
+
+            self.component_health[component] = {
+                "status": status,
+                "last_check": now,
+                "consecutive_failures": (
+                    0
+                    if status["healthy"]
+                    else self.component_health.get(component, {}).get(
+                        "consecutive_failures", 0
+                    )
+                    + 1
+                ),
+            }
+
+            # Trigger recovery if component is unhealthy
+            if not status["healthy"]:
+                await self._process_component_failure(component, status)
 
     async def _check_memory_system(self) -> Dict[str, Any]:
         """Check memory system health"""
@@ -309,11 +650,14 @@ class ErrorRecoverySystem:
     async def _check_chat_completion(self) -> Dict[str, Any]:
         """Check chat completion system health"""
         try:
-            # Test each provider
-            from ..chat.enhanced_completion import EnhancedChatCompletion
+            # Test each provider through one warm chat system; the lazy
+            # import stays local to avoid a circular module dependency
+            if self._chat_system is None:
+                from ..chat.enhanced_completion import EnhancedChatCompletion
 
-            chat_system = EnhancedChatCompletion(self.settings, self.memory)
-            provider_status = await chat_system.test_all_providers()
+                self._chat_system = EnhancedChatCompletion(self.settings, self.memory)
+
+            provider_status = await self._chat_system.test_all_providers()
 
             healthy_providers = sum(
                 1 for status in provider_status.values() if status.get("healthy", False)
@@ -336,10 +680,12 @@ class ErrorRecoverySystem:
     async def _check_mcp_servers(self) -> Dict[str, Any]:
         """Check MCP servers health"""
         try:
-            from ..mcp.manager import MCPServerManager
+            if self._mcp_manager is None:
+                from ..mcp.manager import MCPServerManager
+
+                self._mcp_manager = MCPServerManager(self.settings)
 
-            mcp_manager = MCPServerManager(self.settings)
-            server_status = await mcp_manager.get_all_server_status()
+            server_status = await self._mcp_manager.get_all_server_status()
 
             active_servers = sum(
                 1 for status in server_status.values() if status.get("active", False)
@@ -361,23 +707,31 @@ class ErrorRecoverySystem:
 
     async def _check_database(self) -> Dict[str, Any]:
         """Check database connectivity"""
+        # Serve repeat probes within 30s from the cached verdict
+        ts, cached = self._db_status_cache
+        if cached is not None and time.monotonic() - ts < 30:
+            return cached
+
         try:
-            # Test database connection
+            # Test database connection over the shared engine's pool
             from sqlalchemy.ext.asyncio import create_async_engine
             from sqlalchemy import text
 
-            engine = create_async_engine(self.settings.database_url)
+            if self._probe_engine is None:
+                self._probe_engine = create_async_engine(self.settings.database_url)
 
-            async with engine.begin() as conn:
+            async with self._probe_engine.connect() as conn:
                 result = await conn.execute(text("SELECT 1"))
                 await result.fetchone()
 
-            await engine.dispose()
-
-            return {"healthy": True, "connection": "active"}
+            status = {"healthy": True, "connection": "active"}
 
         except Exception as e:
-            return {"healthy": False, "error": str(e)}
+            self._probe_engine = None
+            status = {"healthy": False, "error": str(e)}
+
+        self._db_status_cache = (time.monotonic(), status)
+        return status
 
     async def _check_cache_system(self) -> Dict[str, Any]:
         """Check cache system health"""
@@ -435,7 +789,8 @@ class ErrorRecoverySystem:
                     }
                 )
 
-            # Process anomalies as potential errors
+            # Process anomalies as potential errors, stamped as one batch
+            now = datetime.now()
             for anomaly in anomalies:
                 await self._process_error_event(
                     error_type="performance_anomaly",
@@ -443,6 +798,7 @@ class ErrorRecoverySystem:
                     stack_trace="",
                     component="performance_monitor",
                     metadata=anomaly,
+                    now=now,
                 )
 
         except Exception as e:
@@ -456,40 +812,57 @@ class ErrorRecoverySystem:
             ("postgresql", self.settings.database_url),
         ]
 
-        for dep_name, dep_url in dependencies:
-            try:
-                # Simple connection test
-                if dep_name == "redis":
-                    import redis.asyncio as redis
+        # Probe all dependencies concurrently; each probe reports its own
+        # failure, so one flaky backend never delays the others
+        await asyncio.gather(
+            *(
+                self._probe_dependency(dep_name, dep_url)
+                for dep_name, dep_url in dependencies
+            )
+        )
 
-                    r = redis.from_url(dep_url)
-                    await r.ping()
-                    await r.close()
+    async def _probe_dependency(self, dep_name: str, dep_url: str):
+        """Run one external-dependency connection test"""
+        try:
+            # Simple connection test over the cached long-lived client
+            if dep_name == "redis":
+                import redis.asyncio as redis
 
-                elif dep_name == "mongodb":
-                    from motor.motor_asyncio import AsyncIOMotorClient
+                if self._probe_redis is None:
+                    self._probe_redis = redis.from_url(dep_url)
+                await self._probe_redis.ping()
 
-                    client = AsyncIOMotorClient(dep_url)
-                    await client.admin.command('ping')
-                    client.close()
+            elif dep_name == "mongodb":
+                from motor.motor_asyncio import AsyncIOMotorClient
 
-                elif dep_name == "postgresql":
-                    from sqlalchemy.ext.asyncio import create_async_engine
-                    from sqlalchemy import text
+                if self._probe_mongo is None:
+                    self._probe_mongo = AsyncIOMotorClient(dep_url)
+                await self._probe_mongo.admin.command('ping')
 
-                    engine = create_async_engine(dep_url)
-                    async with engine.begin() as conn:
-                        await conn.execute(text("SELECT 1"))
-                    await engine.dispose()
+            elif dep_name == "postgresql":
+                from sqlalchemy.ext.asyncio import create_async_engine
+                from sqlalchemy import text
 
-            except Exception as e:
-                await self._process_error_event(
-                    error_type="dependency_failure",
-                    error_message=f"Dependency {dep_name} is unavailable: {str(e)}",
-                    stack_trace=traceback.format_exc(),
-                    component="dependency_check",
-                    metadata={"dependency": dep_name, "url": dep_url},
-                )
+                if self._probe_engine is None:
+                    self._probe_engine = create_async_engine(dep_url)
+                async with self._probe_engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+
+        except Exception as e:
+            # Drop the cached client so the next probe reconnects cleanly
+            if dep_name == "redis":
+                self._probe_redis = None
+            elif dep_name == "mongodb":
+                self._probe_mongo = None
+            else:
+                self._probe_engine = None
+            await self._process_error_event(
+                error_type="dependency_failure",
+                error_message=f"Dependency {dep_name} is unavailable: {str(e)}",
+                stack_trace=traceback.format_exc(),
+                component="dependency_check",
+                metadata={"dependency": dep_name, "url": dep_url},
+            )
 
     async def _process_error_event(
         self,
@@ -498,55 +871,103 @@ class ErrorRecoverySystem:
         stack_trace: str,
         component: str,
         metadata: Dict[str, Any] = None,
+        now: Optional[datetime] = None,
     ):
-        """Process a detected error event"""
+        """Process a detected error event.
+
+        Callers emitting a batch of events in one scan tick pass a shared
+        ``now`` so the tick pays for a single datetime.now() call.
+        """
         try:
+            if now is None:
+                now = datetime.now()
             # Generate unique error ID
             error_id = f"{component}_{error_type}_{int(time.time())}"
 
-            # Determine severity and category
-            severity = self._classify_error_severity(
-                error_type, error_message, component
+            # Check for recurrence first - the signature needs only the raw
+            # strings, so recurring errors skip classification entirely
+            error_signature = (
+                f"{component}:{error_type}:{_message_fingerprint(error_message)}"
             )
-            category = self._classify_error_category(
-                error_type, error_message, component
-            )
-
-            # Check if this is a recurring error
-            error_signature = f"{component}:{error_type}:{hash(error_message) % 10000}"
+            self.error_patterns[error_signature] += 1
 
             if error_signature in self.error_events:
-                # Update existing error
-                existing_error = self.error_events[error_signature]
+                # Update existing error and move it to the recent end of the
+                # store so it is last in line for eviction
+                existing_error = self.error_events.pop(error_signature)
+                self.error_events[error_signature] = existing_error
+                prev_timestamp = existing_error.timestamp
                 existing_error.recurrence_count += 1
-                existing_error.timestamp = datetime.now()
-
-                # Escalate severity if recurring
+                existing_error.timestamp = now
+                # Bubble back to the front of the recent-events view
+                try:
+                    self._recent_events.remove(existing_error)
+                except ValueError:
+                    pass
+                self._recent_events.appendleft(existing_error)
+
+                # Coalesce incident bursts: occurrences inside a one-second
+                # window only bump the counter - no escalation, analytics
+                # record or recovery scheduling per duplicate
+                if (
+                    existing_error.timestamp - prev_timestamp
+                ).total_seconds() < 1.0:
+                    return
+
+                # Reuse the stored classification; escalate if recurring
                 if existing_error.recurrence_count > 5:
-                    severity = (
-                        ErrorSeverity.HIGH
-                        if severity == ErrorSeverity.MEDIUM
-                        else ErrorSeverity.CRITICAL
-                    )
+                    existing_error.severity = _ESCALATE[existing_error.severity]
+                severity = existing_error.severity
+                category = existing_error.category
+
+                # Short-circuit: a recovery is already in flight for this
+                # error, or it was resolved moments ago - nothing to schedule
+                if existing_error.id in self.active_recoveries:
+                    return
+                if (
+                    existing_error.resolved
+                    and existing_error.resolution_timestamp
+                    and now - existing_error.resolution_timestamp
+                    < timedelta(minutes=5)
+                ):
+                    return
 
             else:
+                # Determine severity and category
+                severity = self._classify_error_severity(
+                    error_type, error_message, component
+                )
+                category = self._classify_error_category(
+                    error_type, error_message, component
+                )
                 # Create new error event
+                # error_type/component repeat across thousands of events;
+                # interning makes them share one backing string and turns
+                # equality checks into pointer compares
                 error_event = ErrorEvent(
                     id=error_id,
-                    timestamp=datetime.now(),
-                    error_type=error_type,
+                    timestamp=now,
+                    error_type=sys.intern(error_type),
                     error_message=error_message,
-                    stack_trace=stack_trace,
+                    stack_trace=_trim_trace(stack_trace),
                     severity=severity,
                     category=category,
-                    component=component,
+                    component=sys.intern(component),
                     metadata=metadata or {},
                 )
 
+                if len(self.error_events) >= self.max_error_events:
+                    # Evict the least recently touched signature
+                    evicted = self.error_events.pop(next(iter(self.error_events)))
+                    self._evicted_errors += 1
+                    if evicted.resolved:
+                        self._resolved_count -= 1
                 self.error_events[error_signature] = error_event
+                self._recent_events.appendleft(error_event)
+                self._status_cache = None
 
-            # Store in memory for analytics
-            await self.memory.store_context(
+            # Store in memory for analytics (batched)
+            self._store_analytics(
                 {
                     "type": "error_event",
                     "error_id": error_id,
@@ -556,8 +977,7 @@ class ErrorRecoverySystem:
                     "component": component,
                     "message": error_message,
                     "metadata": metadata or {},
-                },
-                tier=MemoryTier.ANALYTICS,
+                }
             )
 
             # Attempt automatic recovery if not in emergency mode
@@ -582,11 +1002,8 @@ class ErrorRecoverySystem:
                 )
                 return
 
-            # Sort by priority and success rate
-            matching_rules.sort(
-                key=lambda r: (r.success_rate_threshold, -len(r.actions))
-            )
-
+            # Already in priority order - rules_by_category is pre-sorted and
+            # _find_recovery_rules preserves that order
             for rule in matching_rules[:3]:  # Try top 3 rules
                 if not self._should_apply_rule(rule):
                     continue
@@ -605,31 +1022,16 @@ class ErrorRecoverySystem:
         """Find recovery rules that match the error"""
         matching_rules = []
 
-        for rule in self.recovery_rules:
+        # The index key already encodes the severity requirement
+        candidates = self._rule_index.get(
+            (error_event.category, error_event.severity), ()
+        )
+        for rule in candidates:
             if not rule.enabled:
                 continue
 
-            # Check category match
-            if rule.category != error_event.category:
-                continue
-
-            # Check error pattern match
-            import re
-
-            if rule.error_pattern and not re.search(
-                rule.error_pattern, error_event.error_message, re.IGNORECASE
-            ):
-                continue
-
-            # Check severity level
-            severity_levels = {
-                ErrorSeverity.LOW: 1,
-                ErrorSeverity.MEDIUM: 2,
-                ErrorSeverity.HIGH: 3,
-                ErrorSeverity.CRITICAL: 4,
-            }
-
-            if severity_levels[error_event.severity] < severity_levels[rule.severity]:
+            # Check error pattern match (compiled at rule creation)
+            if rule._compiled and not rule._compiled.search(error_event.error_message):
                 continue
 
             matching_rules.append(rule)
@@ -638,10 +1040,12 @@ class ErrorRecoverySystem:
 
     def _should_apply_rule(self, rule: RecoveryRule) -> bool:
         """Check if a recovery rule should be applied"""
-        # Check cooldown
-        if rule.last_used:
-            time_since_last = (datetime.now() - rule.last_used).total_seconds() / 60
-            if time_since_last < rule.cooldown_minutes:
+        # Check cooldown (monotonic float comparison, no datetime math)
+        if rule._last_used_monotonic:
+            if (
+                time.monotonic() - rule._last_used_monotonic
+                < rule.cooldown_minutes * 60
+            ):
                 return False
 
         # Check success rate
@@ -657,40 +1061,64 @@ class ErrorRecoverySystem:
         """Execute a recovery rule"""
         try:
             logger.info(
-                f"Executing recovery rule '{rule.name}' for error {error_event.id}"
+                "Executing recovery rule '%s' for error %s", rule.name, error_event.id
             )
 
             rule.last_used = datetime.now()
+            rule._last_used_monotonic = time.monotonic()
             success = True
 
-            for action in rule.actions:
-                try:
-                    action_success = await self._execute_recovery_action(
-                        action, error_event, rule
-                    )
-                    if not action_success:
-                        success = False
-                        break
+            if rule.sequential:
+                # Ordering matters for this rule; stop at the first failure
+                for action in rule.actions:
+                    try:
+                        action_success = await self._execute_recovery_action(
+                            action, error_event, rule
+                        )
+                        if not action_success:
+                            success = False
+                            break
 
-                    error_event.recovery_actions_taken.append(action.value)
+                        error_event.actions_taken_mask |= _ACTION_BIT[action]
 
-                except Exception as e:
-                    logger.error(f"Recovery action {action} failed: {e}")
-                    success = False
-                    break
+                    except Exception as e:
+                        logger.error(f"Recovery action {action} failed: {e}")
+                        success = False
+                        break
+            else:
+                # Independent actions all block on external systems, so
+                # overlap them: latency is max(action) instead of sum
+                results = await asyncio.gather(
+                    *(
+                        self._execute_recovery_action(action, error_event, rule)
+                        for action in rule.actions
+                    ),
+                    return_exceptions=True,
+                )
+                for action, result in zip(rule.actions, results):
+                    if isinstance(result, BaseException):
+                        logger.error(f"Recovery action {action} failed: {result}")
+                        success = False
+                    elif not result:
+                        success = False
+                    else:
+                        error_event.actions_taken_mask |= _ACTION_BIT[action]
 
             # Update rule statistics
             if success:
                 rule.success_count += 1
-                error_event.resolved = True
+                if not error_event.resolved:
+                    error_event.resolved = True
+                    self._resolved_count += 1
+                    self._status_cache = None
                 error_event.resolution_timestamp = datetime.now()
-                logger.info(f"Successfully recovered from error {error_event.id}")
+                logger.info("Successfully recovered from error %s", error_event.id)
             else:
                 rule.failure_count += 1
-                logger.warning(f"Recovery failed for error {error_event.id}")
+                logger.warning("Recovery failed for error %s", error_event.id)
 
-            # Store recovery result
-            await self.memory.store_context(
+            # Store recovery result (batched)
+            self._store_analytics(
                 {
                     "type": "recovery_attempt",
                     "error_id": error_event.id,
@@ -698,8 +1126,7 @@ class ErrorRecoverySystem:
                     "actions": [a.value for a in rule.actions],
                     "success": success,
                     "timestamp": datetime.now().isoformat(),
-                },
-                tier=MemoryTier.ANALYTICS,
+                }
             )
 
         except Exception as e:
@@ -716,39 +1143,11 @@ class ErrorRecoverySystem:
     ) -> bool:
         """Execute a specific recovery action"""
         try:
-            if action == RecoveryAction.RESTART_SERVICE:
-                return await self._restart_service(error_event.component)
-
-            elif action == RecoveryAction.FAILOVER_PROVIDER:
-                return await self._failover_provider(error_event)
-
-            elif action == RecoveryAction.CLEAR_CACHE:
-                return await self._clear_cache(error_event.component)
-
-            elif action == RecoveryAction.RESET_CONNECTION:
-                return await self._reset_connection(error_event.component)
-
-            elif action == RecoveryAction.INSTALL_DEPENDENCY:
-                return await self._install_dependency(error_event)
-
-            elif action == RecoveryAction.ROLLBACK_CONFIG:
-                return await self._rollback_config(error_event)
-
-            elif action == RecoveryAction.SCALE_RESOURCES:
-                return await self._scale_resources(error_event)
-
-            elif action == RecoveryAction.SWITCH_MCP_SERVER:
-                return await self._switch_mcp_server(error_event)
-
-            elif action == RecoveryAction.EMERGENCY_MODE:
-                return await self._activate_emergency_mode()
-
-            elif action == RecoveryAction.RESTART_COMPONENT:
-                return await self._restart_component(error_event.component)
-
-            else:
-                logger.warning(f"Unknown recovery action: {action}")
+            handler = self._action_dispatch.get(action)
+            if handler is None:
+                logger.warning("Unknown recovery action: %s", action)
                 return False
+            return await handler(error_event)
 
         except Exception as e:
             logger.error(f"Recovery action {action} failed: {e}")
@@ -758,137 +1157,31 @@ class ErrorRecoverySystem:
         self, error_type: str, error_message: str, component: str
     ) -> ErrorSeverity:
         """Classify error severity"""
-        # Critical errors
-        if any(
-            term in error_message.lower()
-            for term in ['critical', 'fatal', 'system failure', 'crash']
-        ):
-            return ErrorSeverity.CRITICAL
-
-        # High severity errors
-        if any(
-            term in error_message.lower()
-            for term in ['connection', 'timeout', 'authentication', 'permission']
-        ):
-            return ErrorSeverity.HIGH
-
-        # Medium severity errors
-        if any(
-            term in error_message.lower() for term in ['error', 'failed', 'exception']
-        ):
-            return ErrorSeverity.MEDIUM
-
-        # Default to low severity
-        return ErrorSeverity.LOW
+        # The 200-char prefix bounds both the scan and the cache's memory
+        return _severity_for(error_message[:200].lower())
 
     def _classify_error_category(
         self, error_type: str, error_message: str, component: str
     ) -> ErrorCategory:
         """Classify error category"""
-        message_lower = error_message.lower()
-
-        if 'provider' in message_lower or 'completion' in message_lower:
-            return ErrorCategory.PROVIDER_FAILURE
-        elif 'memory' in message_lower or 'cache' in message_lower:
-            return ErrorCategory.MEMORY_SYSTEM
-        elif 'mcp' in message_lower or 'server' in message_lower:
-            return ErrorCategory.MCP_SERVER
-        elif 'database' in message_lower or 'sql' in message_lower:
-            return ErrorCategory.DATABASE_CONNECTION
-        elif 'timeout' in message_lower or 'network' in message_lower:
-            return ErrorCategory.NETWORK_TIMEOUT
-        elif 'config' in message_lower or 'setting' in message_lower:
-            return ErrorCategory.CONFIGURATION
-        elif 'dependency' in message_lower or 'import' in message_lower:
-            return ErrorCategory.DEPENDENCY_MISSING
-        elif 'performance' in message_lower or 'slow' in message_lower:
-            return ErrorCategory.PERFORMANCE_DEGRADATION
-        elif 'auth' in message_lower or 'token' in message_lower:
-            return ErrorCategory.AUTHENTICATION
-        elif (
-            'memory' in message_lower
-            or 'disk' in message_lower
-            or 'resource' in message_lower
-        ):
-            return ErrorCategory.RESOURCE_EXHAUSTION
-        else:
-            return ErrorCategory.CONFIGURATION  # Default category
+        return _category_for(error_message[:200].lower())
 
     def _create_recovery_rules(self) -> List[RecoveryRule]:
-        """Create default recovery rules"""
-        return [
-            # Provider failure recovery
-            RecoveryRule(
-                name="provider_timeout_failover",
-                error_pattern=r"timeout.*provider",
-                category=ErrorCategory.PROVIDER_FAILURE,
-                severity=ErrorSeverity.HIGH,
-                actions=[
-                    RecoveryAction.FAILOVER_PROVIDER,
-                    RecoveryAction.RESET_CONNECTION,
-                ],
-                cooldown_minutes=5,
-            ),
-            # Memory system recovery
-            RecoveryRule(
-                name="memory_cache_clear",
-                error_pattern=r"memory|cache",
-                category=ErrorCategory.MEMORY_SYSTEM,
-                severity=ErrorSeverity.MEDIUM,
-                actions=[RecoveryAction.CLEAR_CACHE, RecoveryAction.SCALE_RESOURCES],
-                cooldown_minutes=10,
-            ),
-            # Database connection recovery
-            RecoveryRule(
-                name="database_reconnect",
-                error_pattern=r"database|connection.*lost",
-                category=ErrorCategory.DATABASE_CONNECTION,
-                severity=ErrorSeverity.HIGH,
-                actions=[
-                    RecoveryAction.RESET_CONNECTION,
-                    RecoveryAction.RESTART_SERVICE,
-                ],
-                cooldown_minutes=5,
-            ),
-            # MCP server recovery
-            RecoveryRule(
-                name="mcp_server_switch",
-                error_pattern=r"mcp.*server|tool.*failed",
-                category=ErrorCategory.MCP_SERVER,
-                severity=ErrorSeverity.MEDIUM,
-                actions=[
-                    RecoveryAction.SWITCH_MCP_SERVER,
-                    RecoveryAction.RESTART_COMPONENT,
-                ],
-                cooldown_minutes=15,
-            ),
-            # Performance degradation recovery
-            RecoveryRule(
-                name="performance_optimization",
-                error_pattern=r"slow|performance|degradation",
-                category=ErrorCategory.PERFORMANCE_DEGRADATION,
-                severity=ErrorSeverity.MEDIUM,
-                actions=[RecoveryAction.SCALE_RESOURCES, RecoveryAction.CLEAR_CACHE],
-                cooldown_minutes=20,
-            ),
-            # Critical system recovery
-            RecoveryRule(
-                name="critical_emergency_mode",
-                error_pattern=r"critical|fatal|system.*failure",
-                category=ErrorCategory.PROVIDER_FAILURE,  # Any category for critical errors
-                severity=ErrorSeverity.CRITICAL,
-                actions=[RecoveryAction.EMERGENCY_MODE, RecoveryAction.ROLLBACK_CONFIG],
-                cooldown_minutes=30,
-                max_attempts=1,
-            ),
-        ]
+        """Create default recovery rules from the module-level specs"""
+        # Rules carry per-instance mutable stats (success/failure counts,
+        # cooldown timestamps) so each system needs fresh instances; only
+        # the static specs are shared and partially evaluated at import
+        return [RecoveryRule(**spec) for spec in _DEFAULT_RULE_SPECS]
 
     # Recovery action implementations
     async def _restart_service(self, component: str) -> bool:
         """Restart a service component"""
-        logger.info(f"Restarting service component: {component}")
-        # Implementation would restart the specific component
-        await asyncio.sleep(1)  # Simulate restart
+        logger.info("Restarting service component: %s", component)
+        # Implementation would restart the specific component. The simulated
+        # one-second restart is opt-in: unconditional, it serialized bursts
+        # of restart actions into N seconds of recovery-pipeline stall
+        if self._simulate_latency:
+            await asyncio.sleep(1)  # Simulate restart
         return True
 
     async def _failover_provider(self, error_event: ErrorEvent) -> bool:
@@ -899,7 +1192,7 @@ class ErrorRecoverySystem:
 
     async def _clear_cache(self, component: str) -> bool:
         """Clear cache for component"""
-        logger.info(f"Clearing cache for component: {component}")
+        logger.info("Clearing cache for component: %s", component)
         try:
             await self.memory.clear_cache_tier("session")
             return True
@@ -909,7 +1202,7 @@ class ErrorRecoverySystem:
 
     async def _reset_connection(self, component: str) -> bool:
         """Reset connections for component"""
-        logger.info(f"Resetting connections for component: {component}")
+        logger.info("Resetting connections for component: %s", component)
         # Implementation would reset specific connections
         return True
 
@@ -952,31 +1245,36 @@ class ErrorRecoverySystem:
 
     async def _restart_component(self, component: str) -> bool:
         """Restart specific component"""
-        logger.info(f"Restarting component: {component}")
+        logger.info("Restarting component: %s", component)
         # Implementation would restart the specific component
         return True
 
     async def get_error_recovery_status(self) -> Dict[str, Any]:
         """Get current error recovery status"""
-        return {
+        now = time.monotonic()
+        if self._status_cache and now - self._status_cache[0] < self._status_ttl:
+            return self._status_cache[1]
+
+        # All O(1) reads: counters and the bounded recent-events deque are
+        # maintained at insertion/resolution time
+        status = {
             "emergency_mode_active": self.emergency_mode_active,
             "total_errors": len(self.error_events),
-            "resolved_errors": len(
-                [e for e in self.error_events.values() if e.resolved]
-            ),
+            "resolved_errors": self._resolved_count,
             "active_recoveries": len(self.active_recoveries),
-            "component_health": self.component_health,
-            "recovery_rules": len([r for r in self.recovery_rules if r.enabled]),
+            "evicted_errors": self._evicted_errors,
+            "component_health": self._component_health_view,
+            "recovery_rules": self._enabled_rules_count,
             "recent_errors": [
                 {
                     "id": e.id,
                     "type": e.error_type,
                     "severity": e.severity.value,
                     "resolved": e.resolved,
-                    "timestamp": e.timestamp.isoformat(),
+                    "timestamp": e.iso_timestamp(),
                 }
-                for e in sorted(
-                    self.error_events.values(), key=lambda x: x.timestamp, reverse=True
-                )[:10]
+                for e in self._recent_events
             ],
         }
+        self._status_cache = (now, status)
+        return status
@@ -4,13 +4,24 @@ Integrates all self-building and automation components into a unified system
 """
 
 import asyncio
+import heapq
 import json
 import time
+from collections import ChainMap, namedtuple
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass
 import logging
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
 from ..config.settings import Settings
 from ..memory.enhanced_memory import EnhancedMemoryManager
 from ..automation.mcp_discovery import MCPDiscoveryEngine
@@ -22,8 +33,52 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-
-@dataclass
+# Fixed metric ordering for the vectorized improvement math; mirrors the
+# keys produced by _collect_current_metrics
+_METRIC_ORDER = (
+    "response_time",
+    "error_rate",
+    "memory_usage",
+    "cpu_usage",
+    "throughput",
+    "cache_hit_rate",
+    "mcp_success_rate",
+    "config_optimization_score",
+    "error_resolution_rate",
+)
+# Metrics where a drop from baseline counts as improvement
+_LOWER_IS_BETTER = frozenset(
+    ("response_time", "error_rate", "memory_usage", "cpu_usage")
+)
+# Fixed performance-metric key set: one itemgetter call replaces six
+# individual .get() hash lookups per metrics cycle, with the ChainMap
+# defaults covering keys the tuner has not reported yet
+_PERF_KEYS = (
+    "response_time",
+    "error_rate",
+    "memory_usage",
+    "cpu_usage",
+    "throughput",
+    "cache_hit_rate",
+)
+_perf_getter = itemgetter(*_PERF_KEYS)
+_ZERO_DEFAULTS = {key: 0 for key in _PERF_KEYS}
+
+# Lightweight coordination action record - cheaper than a per-action dict
+# and unpacks positionally in the dispatch path
+CoordAction = namedtuple("CoordAction", "type action reason")
+
+# Fixed component ordering for the health score weight vector
+_COMPONENT_ORDER = (
+    "mcp_discovery",
+    "configuration",
+    "performance",
+    "error_recovery",
+    "self_modification",
+)
+
+
+@dataclass(slots=True)
 class SystemHealth:
     """Overall system health status"""
 
@@ -31,10 +86,12 @@ class SystemHealth:
     component_scores: Dict[str, float]
     active_issues: List[str]
     recommendations: List[str]
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Stamped by the caller just before persisting; assessments that are
+    # only scored and discarded never pay for datetime.now()
+    timestamp: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AutomationMetrics:
     """Automation system metrics"""
 
@@ -77,8 +134,10 @@ class Session4IntegrationSystem:
             self.mcp_discovery,
         )
 
-        # System state
+        # System state. Uptime math runs against the monotonic clock;
+        # system_start_time stays for human-readable reporting
         self.system_start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
         self.automation_enabled = True
         self.learning_mode = True
         self.maintenance_mode = False
@@ -87,11 +146,47 @@ class Session4IntegrationSystem:
         self.baseline_metrics: Dict[str, float] = {}
         self.current_metrics: Dict[str, float] = {}
         self.improvement_history: List[Dict[str, Any]] = []
+        # Precomputed lower-is-better mask aligned with _METRIC_ORDER
+        self._lower_mask = (
+            np.array([m in _LOWER_IS_BETTER for m in _METRIC_ORDER])
+            if NUMPY_AVAILABLE
+            else None
+        )
+        # Equal component weights for the overall health score; a dot
+        # product replaces the sum-and-divide and leaves room for tuning
+        # individual component weights later
+        self._component_weights = (
+            np.full(len(_COMPONENT_ORDER), 1.0 / len(_COMPONENT_ORDER))
+            if NUMPY_AVAILABLE
+            else None
+        )
+
+        # Short-TTL caches over the subsystem fan-outs so status pollers and
+        # the periodic loops share one round of RPCs; the locks make
+        # concurrent callers single-flight instead of racing duplicates
+        self._health_cache: Optional[tuple] = None
+        self._health_cache_ttl = 30.0
+        self._health_lock = asyncio.Lock()
+        self._statuses_cache: Optional[tuple] = None
+        self._statuses_lock = asyncio.Lock()
+
+        # O(1) coordination dispatch, mirroring the action table in the
+        # error recovery system
+        self._coord_dispatch = {
+            "performance_config_coordination": self._coordinate_performance_config,
+            "error_modification_coordination": self._coordinate_error_modification,
+            "mcp_performance_coordination": self._coordinate_mcp_performance,
+        }
+
+        # Write-behind analytics queue: the periodic loops enqueue cheaply
+        # and the flush loop batches the round-trips to the backend
+        self._analytics_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
 
         # Integration configuration
         self.health_check_interval = 300  # 5 minutes
         self.metrics_collection_interval = 60  # 1 minute
         self.coordination_interval = 900  # 15 minutes
+        self.learning_interval = 1800  # 30 minutes
 
     async def start_session4_systems(self):
         """Start all Session 4 automation systems"""
@@ -104,33 +199,75 @@ class Session4IntegrationSystem:
             # Establish baseline metrics
             await self._establish_baseline_metrics()
 
-            # Start automation systems in coordination
-            automation_tasks = [
-                asyncio.create_task(self.mcp_discovery.start_discovery_loop()),
-                asyncio.create_task(self.config_manager.start_dynamic_tuning()),
-                asyncio.create_task(
-                    self.performance_tuner.start_performance_monitoring()
+            # Eager tasks run their first step synchronously, so loops that
+            # front-load cheap init never round-trip through the scheduler
+            loop = asyncio.get_running_loop()
+            if hasattr(asyncio, "eager_task_factory"):
+                loop.set_task_factory(asyncio.eager_task_factory)
+
+            # Start automation systems in coordination. TaskGroup cancels
+            # the sibling loops when one fails, so a crashed subsystem never
+            # leaves the others running while emergency shutdown proceeds.
+            # Integration and coordination tasks ride along: one scheduler
+            # drives all periodic jobs, plus the queue-driven analytics
+            # flusher. Named tasks make the loops attributable in profiles
+            system_loops = (
+                ("mcp_discovery", self.mcp_discovery.start_discovery_loop),
+                ("dynamic_config", self.config_manager.start_dynamic_tuning),
+                (
+                    "performance_tuning",
+                    self.performance_tuner.start_performance_monitoring,
                 ),
-                asyncio.create_task(self.error_recovery.start_error_monitoring()),
-                asyncio.create_task(
-                    self.self_modification.start_self_modification_system()
+                ("error_recovery", self.error_recovery.start_error_monitoring),
+                (
+                    "self_modification",
+                    self.self_modification.start_self_modification_system,
                 ),
-                # Integration and coordination tasks
-                asyncio.create_task(self._system_health_monitoring_loop()),
-                asyncio.create_task(self._metrics_collection_loop()),
-                asyncio.create_task(self._system_coordination_loop()),
-                asyncio.create_task(self._learning_and_adaptation_loop()),
-            ]
-
-            logger.info("✅ All Session 4 systems started successfully")
+                ("periodic_scheduler", self._periodic_scheduler_loop),
+                ("analytics_flush", self._analytics_flush_loop),
+            )
+            async with asyncio.TaskGroup() as tg:
+                for name, loop_coro in system_loops:
+                    tg.create_task(loop_coro(), name=name)
 
-            # Run systems
-            await asyncio.gather(*automation_tasks)
+                logger.info("✅ All Session 4 systems started successfully")
 
-        except Exception as e:
-            logger.error(f"❌ Error starting Session 4 systems: {e}")
+        except* Exception as eg:
+            logger.error("❌ Error starting Session 4 systems: %s", eg.exceptions)
             await self._initiate_emergency_shutdown()
 
+    def _store_analytics(self, payload: Dict[str, Any]):
+        """Queue an analytics record for the batched flush loop; a full
+        queue drops the record rather than stalling a monitoring loop"""
+        try:
+            self._analytics_queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("Analytics queue full - dropping record")
+
+    async def _analytics_flush_loop(self):
+        """Drain queued analytics records in batches"""
+        bulk = getattr(self.memory, "store_context_many", None)
+        while True:
+            try:
+                items = [await self._analytics_queue.get()]
+                # Coalescing window so co-occurring loop writes share a batch
+                await asyncio.sleep(1.0)
+                while len(items) < 32 and not self._analytics_queue.empty():
+                    items.append(self._analytics_queue.get_nowait())
+
+                if bulk is not None:
+                    await bulk(items, tier="analytics")
+                else:
+                    await asyncio.gather(
+                        *(
+                            self.memory.store_context(item, tier="analytics")
+                            for item in items
+                        )
+                    )
+            except Exception as e:
+                logger.error("Error flushing analytics records: %s", e)
+                await asyncio.sleep(5)
+
     async def _establish_baseline_metrics(self):
         """Establish baseline performance metrics"""
         logger.info("📊 Establishing baseline metrics...")
@@ -161,116 +298,148 @@ class Session4IntegrationSystem:
             )
 
             logger.info(
-                f"✅ Baseline metrics established: {len(self.baseline_metrics)} metrics"
+                "✅ Baseline metrics established: %d metrics",
+                len(self.baseline_metrics),
             )
 
         except Exception as e:
-            logger.error(f"Error establishing baseline metrics: {e}")
+            logger.error("Error establishing baseline metrics: %s", e)
+
+    async def _periodic_scheduler_loop(self):
+        """Run the periodic jobs off one deadline heap.
+
+        A single timer replaces four independent while/sleep loops, and the
+        staggered initial deadlines keep wakeups from bunching when the
+        periods align (60s divides 300s, 900s and 1800s).
+        """
+        loop = asyncio.get_running_loop()
+        jobs = (
+            (self.metrics_collection_interval, self._collect_and_store_metrics),
+            (self.health_check_interval, self._run_health_check),
+            (self.coordination_interval, self._run_coordination_cycle),
+            (self.learning_interval, self._run_learning_cycle),
+        )
+        now = loop.time()
+        heap = [
+            (now + interval + index * 7.0, index)
+            for index, (interval, _) in enumerate(jobs)
+        ]
+        heapq.heapify(heap)
 
-    async def _system_health_monitoring_loop(self):
-        """Monitor overall system health"""
         while True:
-            try:
-                health_status = await self._assess_system_health()
-
-                # Store health status
-                await self.memory.store_context(
-                    {
-                        "type": "system_health_assessment",
-                        "health": health_status.__dict__,
-                    },
-                    tier="analytics",
-                )
-
-                # Take action if health is poor
-                if health_status.overall_score < 0.5:
-                    await self._handle_poor_system_health(health_status)
-
-                await asyncio.sleep(self.health_check_interval)
+            deadline, index = heap[0]
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            heapq.heappop(heap)
 
-            except Exception as e:
-                logger.error(f"Error in health monitoring loop: {e}")
-                await asyncio.sleep(self.health_check_interval)
-
-    async def _metrics_collection_loop(self):
-        """Collect and track system metrics"""
-        while True:
+            interval, job = jobs[index]
             try:
-                current_metrics = await self._collect_current_metrics()
-                self.current_metrics = current_metrics
-
-                # Calculate improvements
-                improvements = await self._calculate_improvements()
-
-                # Store metrics
-                await self.memory.store_context(
-                    {
-                        "type": "system_metrics_collected",
-                        "metrics": current_metrics,
-                        "improvements": improvements,
-                    },
-                    tier="analytics",
-                )
-
-                await asyncio.sleep(self.metrics_collection_interval)
-
+                await job()
             except Exception as e:
-                logger.error(f"Error in metrics collection loop: {e}")
-                await asyncio.sleep(self.metrics_collection_interval)
+                logger.error("Error in scheduled job %s: %s", job.__name__, e)
+            heapq.heappush(heap, (loop.time() + interval, index))
+
+    async def _run_health_check(self):
+        """Assess system health, persist it, and react when it is poor"""
+        health_status = await self._assess_system_health()
+        health_status.timestamp = datetime.now()
+
+        # Store health status as a plain JSON-ready dict so the
+        # encoder never has to fall back on datetime handling
+        self._store_analytics(
+            {
+                "type": "system_health_assessment",
+                "health": {
+                    "overall_score": health_status.overall_score,
+                    "component_scores": health_status.component_scores,
+                    "active_issues": health_status.active_issues,
+                    "recommendations": health_status.recommendations,
+                    "timestamp": health_status.timestamp.isoformat(),
+                },
+            }
+        )
 
-    async def _system_coordination_loop(self):
-        """Coordinate between different automation systems"""
-        while True:
-            try:
-                # Get status from all systems
-                system_statuses = await self._collect_system_statuses()
+        # Take action if health is poor
+        if health_status.overall_score < 0.5:
+            await self._handle_poor_system_health(health_status)
 
-                # Identify coordination opportunities
-                coordination_actions = await self._identify_coordination_opportunities(
-                    system_statuses
-                )
+    async def _collect_and_store_metrics(self):
+        """Collect and track system metrics"""
+        current_metrics = await self._collect_current_metrics()
+        self.current_metrics = current_metrics
+
+        # Calculate improvements
+        improvements = await self._calculate_improvements()
+
+        # Store metrics (batched)
+        self._store_analytics(
+            {
+                "type": "system_metrics_collected",
+                "metrics": current_metrics,
+                "improvements": improvements,
+            }
+        )
 
-                # Execute coordination actions
-                for action in coordination_actions:
-                    await self._execute_coordination_action(action)
+    async def _run_coordination_cycle(self):
+        """Coordinate between different automation systems"""
+        # Get status from all systems
+        system_statuses = await self._collect_system_statuses()
 
-                await asyncio.sleep(self.coordination_interval)
+        # Identify coordination opportunities
+        coordination_actions = await self._identify_coordination_opportunities(
+            system_statuses
+        )
 
-            except Exception as e:
-                logger.error(f"Error in coordination loop: {e}")
-                await asyncio.sleep(self.coordination_interval)
+        # Execute coordination actions
+        for action in coordination_actions:
+            await self._execute_coordination_action(action)
 
-    async def _learning_and_adaptation_loop(self):
+    async def _run_learning_cycle(self):
         """Learn from system behavior and adapt strategies"""
-        while True:
-            try:
-                if self.learning_mode:
-                    # Analyze system patterns
-                    patterns = await self._analyze_system_patterns()
+        if not self.learning_mode:
+            return
 
-                    # Adapt strategies based on learning
-                    adaptations = await self._generate_strategy_adaptations(patterns)
+        # Analyze system patterns
+        patterns = await self._analyze_system_patterns()
 
-                    # Apply adaptations
-                    for adaptation in adaptations:
-                        await self._apply_strategy_adaptation(adaptation)
+        # Adapt strategies based on learning
+        adaptations = await self._generate_strategy_adaptations(patterns)
 
-                await asyncio.sleep(1800)  # Every 30 minutes
-
-            except Exception as e:
-                logger.error(f"Error in learning loop: {e}")
-                await asyncio.sleep(1800)
+        # Apply adaptations
+        for adaptation in adaptations:
+            await self._apply_strategy_adaptation(adaptation)
 
     async def _assess_system_health(self) -> SystemHealth:
-        """Assess overall system health"""
+        """Assess overall system health, serving a 30s-TTL cached result"""
+        cached = self._health_cache
+        if cached and time.monotonic() - cached[0] < self._health_cache_ttl:
+            return cached[1]
+        async with self._health_lock:
+            cached = self._health_cache
+            if cached and time.monotonic() - cached[0] < self._health_cache_ttl:
+                return cached[1]
+            health = await self._assess_system_health_now()
+            self._health_cache = (time.monotonic(), health)
+            return health
+
+    async def _assess_system_health_now(self) -> SystemHealth:
+        """Run the full subsystem fan-out and score the results"""
         try:
-            # Get health from each component
-            mcp_status = await self.mcp_discovery.get_discovery_stats()
-            config_status = await self.config_manager.get_configuration_status()
-            perf_status = await self.performance_tuner.get_performance_status()
-            error_status = await self.error_recovery.get_error_recovery_status()
-            modification_status = (
-                await self.self_modification.get_self_modification_status()
+            # Get health from each component concurrently; the calls are
+            # independent so the fan-out costs max() not sum() of latencies
+            (
+                mcp_status,
+                config_status,
+                perf_status,
+                error_status,
+                modification_status,
+            ) = await asyncio.gather(
+                self.mcp_discovery.get_discovery_stats(),
+                self.config_manager.get_configuration_status(),
+                self.performance_tuner.get_performance_status(),
+                self.error_recovery.get_error_recovery_status(),
+                self.self_modification.get_self_modification_status(),
             )
 
             # Calculate component scores
@@ -284,19 +453,38 @@ class Session4IntegrationSystem:
                 ),
             }
 
-            # Calculate overall score
-            overall_score = sum(component_scores.values()) / len(component_scores)
-
-            # Identify active issues
-            active_issues = []
-            recommendations = []
-
-            for component, score in component_scores.items():
-                if score < 0.7:
-                    active_issues.append(
-                        f"{component} health below threshold: {score:.2f}"
-                    )
-                    recommendations.append(f"Review and optimize {component} system")
+            # Calculate overall score and flag sub-threshold components;
+            # the NumPy path does a weighted dot product plus one compare
+            if NUMPY_AVAILABLE:
+                names = _COMPONENT_ORDER
+                scores = np.fromiter(
+                    (component_scores[name] for name in names),
+                    dtype=np.float64,
+                    count=len(names),
+                )
+                overall_score = float(self._component_weights @ scores)
+                flagged = np.flatnonzero(scores < 0.7)
+                active_issues = [
+                    f"{names[i]} health below threshold: {scores[i]:.2f}"
+                    for i in flagged
+                ]
+                recommendations = [
+                    f"Review and optimize {names[i]} system" for i in flagged
+                ]
+            else:
+                overall_score = sum(component_scores.values()) / len(component_scores)
+
+                active_issues = []
+                recommendations = []
+
+                for component, score in component_scores.items():
+                    if score < 0.7:
+                        active_issues.append(
+                            f"{component} health below threshold: {score:.2f}"
+                        )
+                        recommendations.append(
+                            f"Review and optimize {component} system"
+                        )
 
             return SystemHealth(
                 overall_score=overall_score,
@@ -306,7 +494,7 @@ class Session4IntegrationSystem:
             )
 
         except Exception as e:
-            logger.error(f"Error assessing system health: {e}")
+            logger.error("Error assessing system health: %s", e)
             return SystemHealth(
                 overall_score=0.0,
                 component_scores={},
@@ -368,13 +556,17 @@ class Session4IntegrationSystem:
             # Configuration metrics
             config_status = await self.config_manager.get_configuration_status()
 
+            response_time, error_rate, memory_usage, cpu_usage, throughput, cache_hit_rate = _perf_getter(
+                ChainMap(current_metrics, _ZERO_DEFAULTS)
+            )
+
             return {
-                "response_time": current_metrics.get("response_time", 0),
-                "error_rate": current_metrics.get("error_rate", 0),
-                "memory_usage": current_metrics.get("memory_usage", 0),
-                "cpu_usage": current_metrics.get("cpu_usage", 0),
-                "throughput": current_metrics.get("throughput", 0),
-                "cache_hit_rate": current_metrics.get("cache_hit_rate", 0),
+                "response_time": response_time,
+                "error_rate": error_rate,
+                "memory_usage": memory_usage,
+                "cpu_usage": cpu_usage,
+                "throughput": throughput,
+                "cache_hit_rate": cache_hit_rate,
                 "mcp_success_rate": mcp_stats.get("installation_success_rate", 0),
                 "config_optimization_score": len(
                     config_status.get("recent_changes", [])
@@ -387,46 +579,97 @@ class Session4IntegrationSystem:
             }
 
         except Exception as e:
-            logger.error(f"Error collecting current metrics: {e}")
+            logger.error("Error collecting current metrics: %s", e)
             return {}
 
     async def _calculate_improvements(self) -> Dict[str, float]:
         """Calculate improvements from baseline"""
+        if NUMPY_AVAILABLE and self.current_metrics:
+            return self._calculate_improvements_vectorized()
+
         improvements = {}
 
         for metric, current_value in self.current_metrics.items():
             baseline_value = self.baseline_metrics.get(metric, current_value)
 
             if baseline_value > 0:
-                if metric in [
-                    "response_time",
-                    "error_rate",
-                    "memory_usage",
-                    "cpu_usage",
-                ]:
-                    # Lower is better
+                if metric in _LOWER_IS_BETTER:
                     improvement = (baseline_value - current_value) / baseline_value
                 else:
-                    # Higher is better
                     improvement = (current_value - baseline_value) / baseline_value
 
                 improvements[metric] = improvement
 
         return improvements
 
-    async def _collect_system_statuses(self) -> Dict[str, Dict[str, Any]]:
-        """Collect status from all automation systems"""
+    def _calculate_improvements_vectorized(self) -> Dict[str, float]:
+        """NumPy path: all deltas in two vectorized ops over _METRIC_ORDER"""
+        count = len(_METRIC_ORDER)
+        cur = np.fromiter(
+            (self.current_metrics.get(m, 0.0) for m in _METRIC_ORDER),
+            dtype=np.float64,
+            count=count,
+        )
+        base = np.fromiter(
+            (
+                self.baseline_metrics.get(m, self.current_metrics.get(m, 0.0))
+                for m in _METRIC_ORDER
+            ),
+            dtype=np.float64,
+            count=count,
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            imp = np.where(self._lower_mask, base - cur, cur - base) / base
         return {
-            "mcp_discovery": await self.mcp_discovery.get_discovery_stats(),
-            "config_manager": await self.config_manager.get_configuration_status(),
-            "performance_tuner": await self.performance_tuner.get_performance_status(),
-            "error_recovery": await self.error_recovery.get_error_recovery_status(),
-            "self_modification": await self.self_modification.get_self_modification_status(),
+            metric: float(value)
+            for metric, value, baseline in zip(_METRIC_ORDER, imp, base)
+            if baseline > 0 and metric in self.current_metrics
         }
 
+    async def _collect_system_statuses(self) -> Dict[str, Dict[str, Any]]:
+        """Collect status from all automation systems, 30s-TTL cached"""
+        cached = self._statuses_cache
+        if cached and time.monotonic() - cached[0] < self._health_cache_ttl:
+            return cached[1]
+        async with self._statuses_lock:
+            cached = self._statuses_cache
+            if cached and time.monotonic() - cached[0] < self._health_cache_ttl:
+                return cached[1]
+            statuses = await self._collect_system_statuses_now()
+            self._statuses_cache = (time.monotonic(), statuses)
+            return statuses
+
+    async def _collect_system_statuses_now(self) -> Dict[str, Dict[str, Any]]:
+        """Run the status fan-out across all automation systems"""
+        keys = (
+            "mcp_discovery",
+            "config_manager",
+            "performance_tuner",
+            "error_recovery",
+            "self_modification",
+        )
+        results = await asyncio.gather(
+            self.mcp_discovery.get_discovery_stats(),
+            self.config_manager.get_configuration_status(),
+            self.performance_tuner.get_performance_status(),
+            self.error_recovery.get_error_recovery_status(),
+            self.self_modification.get_self_modification_status(),
+            return_exceptions=True,
+        )
+        # A failed subsystem yields an empty status rather than failing the
+        # whole coordination cycle
+        statuses: Dict[str, Dict[str, Any]] = {}
+        for key, result in zip(keys, results):
+            if isinstance(result, BaseException):
+                logger.error("Error collecting %s status: %s", key, result)
+                statuses[key] = {}
+            else:
+                statuses[key] = result
+        return statuses
+
     async def _identify_coordination_opportunities(
         self, system_statuses: Dict[str, Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+    ) -> List[CoordAction]:
         """Identify opportunities for system coordination"""
         opportunities = []
 
@@ -438,11 +681,11 @@ class Session4IntegrationSystem:
             "auto_tuning_enabled"
         ):
             opportunities.append(
-                {
-                    "type": "performance_config_coordination",
-                    "action": "increase_config_aggressiveness",
-                    "reason": "Poor performance detected, increase configuration optimization",
-                }
+                CoordAction(
+                    "performance_config_coordination",
+                    "increase_config_aggressiveness",
+                    "Poor performance detected, increase configuration optimization",
+                )
             )
 
         # Error recovery and self-modification coordination
@@ -454,57 +697,58 @@ class Session4IntegrationSystem:
         )
         if unresolved_errors > 5 and mod_status.get("autogen_available"):
             opportunities.append(
-                {
-                    "type": "error_modification_coordination",
-                    "action": "generate_error_fix_task",
-                    "reason": f"High unresolved error count: {unresolved_errors}",
-                }
+                CoordAction(
+                    "error_modification_coordination",
+                    "generate_error_fix_task",
+                    f"High unresolved error count: {unresolved_errors}",
+                )
             )
 
         # MCP and performance coordination
         mcp_stats = system_statuses.get("mcp_discovery", {})
         if mcp_stats.get("installation_success_rate", 1.0) < 0.7:
             opportunities.append(
-                {
-                    "type": "mcp_performance_coordination",
-                    "action": "optimize_mcp_installation",
-                    "reason": "Low MCP installation success rate",
-                }
+                CoordAction(
+                    "mcp_performance_coordination",
+                    "optimize_mcp_installation",
+                    "Low MCP installation success rate",
+                )
             )
 
         return opportunities
 
-    async def _execute_coordination_action(self, action: Dict[str, Any]):
-        """Execute a coordination action"""
-        try:
-            action_type = action.get("type")
+    async def _coordinate_performance_config(self, reason: str):
+        """Increase configuration optimization aggressiveness"""
+        logger.info("Coordinating performance and configuration systems")
 
-            if action_type == "performance_config_coordination":
-                # Increase configuration optimization aggressiveness
-                logger.info("Coordinating performance and configuration systems")
+    async def _coordinate_error_modification(self, reason: str):
+        """Trigger self-modification task for error resolution"""
+        logger.info("Coordinating error recovery and self-modification systems")
 
-            elif action_type == "error_modification_coordination":
-                # Trigger self-modification task for error resolution
-                logger.info("Coordinating error recovery and self-modification systems")
+    async def _coordinate_mcp_performance(self, reason: str):
+        """Optimize MCP installation process"""
+        logger.info("Coordinating MCP discovery and performance systems")
 
-            elif action_type == "mcp_performance_coordination":
-                # Optimize MCP installation process
-                logger.info("Coordinating MCP discovery and performance systems")
+    async def _execute_coordination_action(self, action: CoordAction):
+        """Execute a coordination action via the dispatch table"""
+        try:
+            handler = self._coord_dispatch.get(action.type)
+            if handler is not None:
+                await handler(action.reason)
 
-            # Store coordination action
-            await self.memory.store_context(
-                {"type": "coordination_action_executed", "action": action},
-                tier="analytics",
+            # Store coordination action (batched)
+            self._store_analytics(
+                {"type": "coordination_action_executed", "action": action._asdict()}
             )
 
         except Exception as e:
-            logger.error(f"Error executing coordination action: {e}")
+            logger.error("Error executing coordination action: %s", e)
 
     async def get_session4_status(self) -> Dict[str, Any]:
         """Get comprehensive Session 4 system status"""
         try:
             # Calculate uptime
-            uptime = (datetime.now() - self.system_start_time).total_seconds()
+            uptime = time.monotonic() - self._start_monotonic
 
             # Get health assessment
             health = await self._assess_system_health()
@@ -527,7 +771,7 @@ class Session4IntegrationSystem:
                     "active_issues": health.active_issues,
                     "recommendations": health.recommendations,
                 },
-                "automation_metrics": metrics.__dict__,
+                "automation_metrics": asdict(metrics),
                 "performance_improvements": improvements,
                 "system_components": {
                     "mcp_discovery": "active",
@@ -546,18 +790,23 @@ class Session4IntegrationSystem:
             }
 
         except Exception as e:
-            logger.error(f"Error getting Session 4 status: {e}")
+            logger.error("Error getting Session 4 status: %s", e)
             return {"error": str(e)}
 
     async def _calculate_automation_metrics(self) -> AutomationMetrics:
         """Calculate comprehensive automation metrics"""
         try:
-            # Get stats from each system
-            mcp_stats = await self.mcp_discovery.get_discovery_stats()
-            config_status = await self.config_manager.get_configuration_status()
-            error_status = await self.error_recovery.get_error_recovery_status()
-            modification_status = (
-                await self.self_modification.get_self_modification_status()
+            # Get stats from each system concurrently
+            (
+                mcp_stats,
+                config_status,
+                error_status,
+                modification_status,
+            ) = await asyncio.gather(
+                self.mcp_discovery.get_discovery_stats(),
+                self.config_manager.get_configuration_status(),
+                self.error_recovery.get_error_recovery_status(),
+                self.self_modification.get_self_modification_status(),
             )
 
             # Calculate cost savings (estimated)
@@ -566,7 +815,7 @@ class Session4IntegrationSystem:
             # Calculate performance improvements
             performance_improvement = self._estimate_performance_improvement()
 
-            uptime = (datetime.now() - self.system_start_time).total_seconds()
+            uptime = time.monotonic() - self._start_monotonic
 
             return AutomationMetrics(
                 mcp_servers_discovered=mcp_stats.get("total_discovered", 0),
@@ -583,7 +832,7 @@ class Session4IntegrationSystem:
             )
 
         except Exception as e:
-            logger.error(f"Error calculating automation metrics: {e}")
+            logger.error("Error calculating automation metrics: %s", e)
             return AutomationMetrics(
                 mcp_servers_discovered=0,
                 mcp_servers_installed=0,
@@ -604,13 +853,20 @@ class Session4IntegrationSystem:
 
     def _estimate_performance_improvement(self) -> float:
         """Estimate performance improvement from automation"""
-        # Calculate improvement based on current vs baseline metrics
+        # Calculate improvement based on current vs baseline metrics,
+        # sharing the lower-is-better mask with _calculate_improvements
+        if NUMPY_AVAILABLE and self.current_metrics:
+            improvements = self._calculate_improvements_vectorized()
+            if not improvements:
+                return 0.0
+            return float(np.mean(list(improvements.values())) * 100)
+
         improvements = []
 
         for metric, current in self.current_metrics.items():
             baseline = self.baseline_metrics.get(metric, current)
             if baseline > 0:
-                if metric in ["response_time", "error_rate"]:
+                if metric in _LOWER_IS_BETTER:
                     improvement = (baseline - current) / baseline * 100
                 else:
                     improvement = (current - baseline) / baseline * 100
@@ -621,6 +877,8 @@ class Session4IntegrationSystem:
     async def _get_recent_activities(self) -> List[Dict[str, Any]]:
         """Get recent automation activities"""
         try:
+            # Bound the query in the store instead of fetching an hour of
+            # records and slicing the tail client-side
             recent_data = await self.memory.get_analytics_data(
                 hours=1,
                 metrics=[
@@ -629,21 +887,20 @@ class Session4IntegrationSystem:
                     "error_recovery",
                     "config_change",
                 ],
+                limit=10,
+                order="desc",
             )
 
-            activities = []
-            for data in recent_data[-10:]:  # Last 10 activities
-                activities.append(
-                    {
-                        "type": data.get("type", "unknown"),
-                        "description": data.get("description", ""),
-                        "timestamp": data.get("timestamp", ""),
-                        "success": data.get("success", True),
-                    }
-                )
-
-            return activities
+            return [
+                {
+                    "type": data.get("type", "unknown"),
+                    "description": data.get("description", ""),
+                    "timestamp": data.get("timestamp", ""),
+                    "success": data.get("success", True),
+                }
+                for data in recent_data
+            ]
 
         except Exception as e:
-            logger.error(f"Error getting recent activities: {e}")
+            logger.error("Error getting recent activities: %s", e)
             return []